@@ -4,25 +4,50 @@ PostgreSQL integration using psycopg2 with connection pooling
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
-from psycopg2 import IntegrityError, OperationalError
+from psycopg2.extras import RealDictCursor, Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2 import IntegrityError, OperationalError, InterfaceError
+from psycopg2.errors import UniqueViolation  # re-exported for routers mapping duplicates to 409
 from contextlib import contextmanager
-from typing import Optional, Dict, List, Any
-from datetime import date, datetime, time
+import copy
+import csv
+import functools
+import io
+from typing import Optional, Dict, List, Any, Iterable, Sequence, Tuple
 import logging
+import time
 
 from app.config import settings
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize JSON query parameters with orjson (psycopg2 needs str)"""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+    _json_dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
 
+class _PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has PREPAREd and when it was last used"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+        self.last_used = time.monotonic()
+
+
 class Database:
     """PostgreSQL database connection manager with pooling"""
 
-    _pool: Optional[SimpleConnectionPool] = None
+    _pool: Optional[ThreadedConnectionPool] = None
+
+    # Pooled connections idle longer than this are pinged before reuse
+    IDLE_PING_SECONDS = 30.0
 
     @classmethod
     def initialize(cls):
@@ -33,15 +58,16 @@ class Database:
             # Parse DATABASE_URL
             db_url = settings.DATABASE_URL
 
-            cls._pool = SimpleConnectionPool(
+            cls._pool = ThreadedConnectionPool(
                 settings.DB_POOL_MIN,
                 settings.DB_POOL_MAX,
-                dsn=db_url
+                dsn=db_url,
+                connection_factory=_PreparingConnection
             )
-            logger.info(f"✅ Database pool initialized: {settings.DB_POOL_MIN}-{settings.DB_POOL_MAX} connections")
+            logger.info("✅ Database pool initialized: %s-%s connections", settings.DB_POOL_MIN, settings.DB_POOL_MAX)
             return True
         except Exception as e:
-            logger.error(f"❌ Database initialization failed: {e}")
+            logger.error("❌ Database initialization failed: %s", e)
             return False
 
     @classmethod
@@ -58,19 +84,80 @@ class Database:
         if cls._pool is None:
             raise Exception("Database pool not initialized. Call Database.initialize() first.")
 
-        conn = None
+        conn = cls._checkout()
         try:
-            conn = cls._pool.getconn()
             yield conn
             conn.commit()  # Auto-commit on success
         except Exception as e:
-            if conn:
+            logger.error("Database error: %s", e)
+            try:
                 conn.rollback()  # Rollback on error
-            logger.error(f"Database error: {e}")
+            except (OperationalError, InterfaceError):
+                # Connection died mid-transaction; _release below discards it
+                pass
             raise
         finally:
-            if conn:
-                cls._pool.putconn(conn)
+            # Returned exactly once; broken connections are closed, not pooled
+            cls._release(conn)
+
+    @classmethod
+    def ping(cls) -> None:
+        """
+        Check the database is reachable from a pooled connection
+
+        Runs a single autocommit SELECT 1 (no BEGIN/COMMIT round trips),
+        retrying once on a fresh connection if the pooled one was stale.
+        Raises if the database can't be reached.
+        """
+        if cls._pool is None:
+            raise Exception("Database pool not initialized. Call Database.initialize() first.")
+
+        for attempt in range(2):
+            conn = cls._pool.getconn()
+            broken = False
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                return
+            except (OperationalError, InterfaceError):
+                broken = True
+                if attempt:
+                    raise
+                logger.warning("Replacing stale database connection during ping")
+            finally:
+                if not (broken or conn.closed):
+                    conn.autocommit = False
+                cls._release(conn, close=broken)
+
+    @classmethod
+    def _checkout(cls):
+        """
+        Take a connection from the pool, replacing it if the server dropped it
+
+        Connections idle for a while can be closed server-side (idle timeouts,
+        network blips), so only those are pinged before reuse; recently used
+        ones skip the extra round trip.
+        """
+        conn = cls._pool.getconn()
+        try:
+            if conn.closed:
+                raise InterfaceError("connection already closed")
+            if time.monotonic() - conn.last_used > cls.IDLE_PING_SECONDS:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.close()
+        except (OperationalError, InterfaceError) as e:
+            logger.warning("Replacing stale database connection: %s", e)
+            cls._pool.putconn(conn, close=True)
+            conn = cls._pool.getconn()
+        return conn
+
+    @classmethod
+    def _release(cls, conn, close: bool = False):
+        """Return a connection to the pool, closing it if it is broken"""
+        conn.last_used = time.monotonic()
+        cls._pool.putconn(conn, close=close or bool(conn.closed))
 
     @classmethod
     def execute(cls, query: str, params: tuple = None, fetch: str = "all") -> Optional[List[Dict]]:
@@ -84,28 +171,110 @@ class Database:
 
         Returns:
             List of dictionaries (fetch="all"), single dictionary (fetch="one"), or None
+
+        Note:
+            Date/time columns are returned as native date/datetime/time values;
+            they are serialized once, by the JSON encoder at the response boundary
         """
         with cls.get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             cursor.execute(query, params)
 
             if fetch == "all":
-                result = cursor.fetchall()
-                return [cls._serialize_row(dict(row)) for row in result] if result else []
+                return cursor.fetchall()
             elif fetch == "one":
-                result = cursor.fetchone()
-                return cls._serialize_row(dict(result)) if result else None
+                return cursor.fetchone()
             else:
                 # fetch="none" for INSERT/UPDATE/DELETE
                 return None
 
-    @staticmethod
-    def _serialize_row(row: Dict) -> Dict:
-        """Convert date/datetime/time objects to ISO format strings"""
-        for key, value in row.items():
-            if isinstance(value, (date, datetime, time)):
-                row[key] = value.isoformat()
-        return row
+    @classmethod
+    def execute_tuples(cls, query: str, params: tuple = None, columns: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        Execute a query on a plain tuple cursor and map rows to dictionaries
+
+        Cheaper than RealDictCursor on hot list queries: the driver returns
+        tuples and each row becomes a dict through a single zip.
+
+        Args:
+            query: SQL query
+            params: Query parameters (tuple)
+            columns: Keys for each row (defaults to the result column names)
+
+        Returns:
+            List of dictionaries
+        """
+        with cls.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            if columns is None:
+                columns = [col.name for col in cursor.description]
+
+        return [dict(zip(columns, row)) for row in rows]
+
+    @classmethod
+    def execute_many(cls, query: str, rows: Sequence[Sequence], template: Optional[str] = None,
+                     page_size: int = 1000, fetch: bool = False) -> Optional[List[Dict]]:
+        """
+        Insert many rows with multi-row VALUES statements
+
+        Rows are sent `page_size` at a time, so N rows cost ceil(N / page_size)
+        round trips instead of N.
+
+        Args:
+            query: SQL query with a single "VALUES %s" placeholder
+            rows: Sequence of row tuples (or dicts, with a named template)
+            template: Optional per-row template, e.g. "(%s, %s, now())"
+            page_size: Rows per statement
+            fetch: Return the RETURNING rows of every page
+
+        Returns:
+            List of dictionaries (fetch=True) or None
+        """
+        if not rows:
+            return [] if fetch else None
+
+        with cls.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            result = execute_values(cursor, query, rows, template=template, page_size=page_size, fetch=fetch)
+
+        return result if fetch else None
+
+    @classmethod
+    def execute_prepared(cls, name: str, query: str, params: tuple = (), fetch: str = "one") -> Optional[List[Dict]]:
+        """
+        Execute a hot query as a server-side prepared statement
+
+        The statement is PREPAREd once per pooled connection and EXECUTEd
+        afterwards, so PostgreSQL parses and plans it only once.
+
+        Args:
+            name: Statement name (unique per query text)
+            query: SQL query using $1, $2, ... placeholders
+            params: Query parameters (tuple)
+            fetch: "all", "one", or "none"
+
+        Returns:
+            List of dictionaries (fetch="all"), single dictionary (fetch="one"), or None
+        """
+        with cls.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            if name not in conn.prepared:
+                cursor.execute(f"PREPARE {name} AS {query}")
+                conn.prepared.add(name)
+
+            if params:
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+
+            if fetch == "all":
+                return cursor.fetchall()
+            elif fetch == "one":
+                return cursor.fetchone()
+            else:
+                return None
 
     @classmethod
     def close(cls):
@@ -115,71 +284,136 @@ class Database:
             logger.info("✅ Database connections closed")
 
 
+# ============================================================
+# QUERY HELPERS
+# ============================================================
+
+# (API field, column) pairs accepted by update_patient
+_PATIENT_UPDATE_FIELDS = (
+    ('name', 'name'),
+    ('email', 'email'),
+    ('phone', 'phone'),
+    ('dateOfBirth', 'date_of_birth'),
+    ('gender', 'gender'),
+    ('medicalHistory', 'medical_history'),
+)
+
+# Columns accepted by update_appointment
+_APPOINTMENT_UPDATE_FIELDS = ('status', 'notes', 'appointment_date', 'appointment_time')
+
+
+@functools.lru_cache(maxsize=128)
+def _build_update_query(table: str, columns: Tuple[str, ...], returning: str = "*") -> str:
+    """Build (once per table/column combination) an UPDATE ... RETURNING by id"""
+    set_clause = ', '.join(f"{column} = %({column})s" for column in columns)
+    return f"""
+        UPDATE {table}
+        SET {set_clause}
+        WHERE id = %(id)s
+        RETURNING {returning}
+    """
+
+
+def _ttl_cache(ttl: float, maxsize: int = 1024):
+    """
+    Memoize a read helper for `ttl` seconds
+
+    The cache lives in this process only: writes made here invalidate it
+    through cache_clear() / cache_pop(*args), but writes from other workers
+    or processes are only seen once the entry expires, so results can be up
+    to `ttl` seconds stale. Misses (None) are not cached, so newly created
+    rows are found immediately. Callers get their own deep copy of the
+    cached value and may modify it freely.
+    """
+    def decorator(func):
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and hit[0] > now:
+                return copy.deepcopy(hit[1])
+
+            value = func(*args)
+            if value is None:
+                return None
+            if len(cache) >= maxsize:
+                cache.clear()
+            cache[args] = (now + ttl, value)
+            return copy.deepcopy(value)
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_pop = lambda *args: cache.pop(args, None)
+        return wrapper
+
+    return decorator
+
+
 # ============================================================
 # PATIENT DATABASE FUNCTIONS
 # ============================================================
 
+_PATIENT_COLUMNS = "id, name, email, phone, date_of_birth, gender, medical_history, created_at, updated_at"
+
+
 def get_patient(patient_id: str) -> Optional[Dict]:
     """Get patient by ID"""
-    query = "SELECT * FROM patients WHERE id = %s"
-    return Database.execute(query, (patient_id,), fetch="one")
+    query = f"""
+        SELECT {_PATIENT_COLUMNS}
+        FROM patients
+        WHERE id = $1
+    """
+    return Database.execute_prepared("get_patient", query, (patient_id,))
 
 
 def create_patient(patient_data: Dict) -> Dict:
     """Create a new patient"""
-    query = """
+    query = f"""
         INSERT INTO patients (id, name, email, phone, date_of_birth, gender, medical_history)
         VALUES (%(id)s, %(name)s, %(email)s, %(phone)s, %(dateOfBirth)s, %(gender)s, %(medicalHistory)s)
-        RETURNING *
+        RETURNING {_PATIENT_COLUMNS}
     """
-    Database.execute(query, patient_data, fetch="none")
-    return get_patient(patient_data['id'])
+    return Database.execute(query, patient_data, fetch="one")
 
 
 def update_patient(patient_id: str, updates: Dict) -> Optional[Dict]:
     """Update patient information"""
-    set_clauses = []
-    params = {}
-
-    field_mapping = {
-        'name': 'name',
-        'email': 'email',
-        'phone': 'phone',
-        'dateOfBirth': 'date_of_birth',
-        'gender': 'gender',
-        'medicalHistory': 'medical_history'
-    }
+    fields = [(key, column) for key, column in _PATIENT_UPDATE_FIELDS if updates.get(key) is not None]
 
-    for key, db_field in field_mapping.items():
-        if key in updates and updates[key] is not None:
-            set_clauses.append(f"{db_field} = %({db_field})s")
-            params[db_field] = updates[key]
-
-    if not set_clauses:
+    if not fields:
         return get_patient(patient_id)
 
+    params = {column: updates[key] for key, column in fields}
     params['id'] = patient_id
-    query = f"""
-        UPDATE patients
-        SET {', '.join(set_clauses)}
-        WHERE id = %(id)s
-        RETURNING *
-    """
+    query = _build_update_query("patients", tuple(column for _, column in fields), _PATIENT_COLUMNS)
 
-    Database.execute(query, params, fetch="none")
-    return get_patient(patient_id)
+    return Database.execute(query, params, fetch="one")
 
 
-def get_all_patients() -> List[Dict]:
-    """Get all patients"""
-    query = "SELECT * FROM patients ORDER BY created_at DESC"
-    return Database.execute(query, fetch="all")
+def get_all_patients(limit: int = 100, offset: int = 0) -> List[Dict]:
+    """Get a page of patients (newest first)"""
+    query = """
+        SELECT id, name, email, phone, date_of_birth, gender, created_at, updated_at
+        FROM patients
+        ORDER BY created_at DESC
+        LIMIT %s OFFSET %s
+    """
+    return Database.execute_tuples(query, (limit, offset))
 
 
 def delete_patient(patient_id: str) -> bool:
     """Delete a patient"""
-    query = "DELETE FROM patients WHERE id = %s"
-    Database.execute(query, (patient_id,), fetch="none")
+    # The cascade removes the patient's scans; the outer SELECT still sees them
+    # (statement snapshot), so their ids can be evicted from the get_scan cache
+    query = """
+        WITH deleted AS (
+            DELETE FROM patients WHERE id = %s RETURNING id
+        )
+        SELECT s.id FROM scans s JOIN deleted d ON s.patient_id = d.id
+    """
+    for row in Database.execute(query, (patient_id,), fetch="all"):
+        get_scan.cache_pop(row['id'])
     return True
 
 
@@ -187,33 +421,54 @@ def delete_patient(patient_id: str) -> bool:
 # DOCTOR DATABASE FUNCTIONS
 # ============================================================
 
+# Public doctor columns; password_hash is deliberately left out of cached reads
+_DOCTOR_COLUMNS = "id, name, email, phone, specialization, license_number, created_at"
+
+
+@_ttl_cache(ttl=30)
 def get_all_doctors() -> List[Dict]:
     """Get all doctors"""
-    query = "SELECT id, name, email, phone, specialization, license_number, created_at FROM doctors ORDER BY name"
-    return Database.execute(query, fetch="all")
+    query = f"SELECT {_DOCTOR_COLUMNS} FROM doctors ORDER BY name"
+    return Database.execute_tuples(query)
 
 
+@_ttl_cache(ttl=30)
 def get_doctor(doctor_id: str) -> Optional[Dict]:
     """Get doctor by ID"""
-    query = "SELECT id, name, email, phone, specialization, license_number, created_at FROM doctors WHERE id = %s"
-    return Database.execute(query, (doctor_id,), fetch="one")
+    query = f"SELECT {_DOCTOR_COLUMNS} FROM doctors WHERE id = $1"
+    return Database.execute_prepared("get_doctor", query, (doctor_id,))
 
 
+@_ttl_cache(ttl=30)
 def get_doctor_by_email(email: str) -> Optional[Dict]:
-    """Get doctor by email (for authentication)"""
+    """Get doctor by email (public columns only)"""
+    query = f"SELECT {_DOCTOR_COLUMNS} FROM doctors WHERE email = $1"
+    return Database.execute_prepared("get_doctor_by_email", query, (email,))
+
+
+def get_doctor_credentials(email: str) -> Optional[Dict]:
+    """Get the full doctor row, password hash included, for authentication (never cached)"""
+    # Not prepared: a long-lived prepared SELECT * would fail with "cached plan
+    # must not change result type" after any ALTER TABLE doctors, and planning
+    # is negligible next to the bcrypt check that follows
     query = "SELECT * FROM doctors WHERE email = %s"
     return Database.execute(query, (email,), fetch="one")
 
 
-def create_doctor(doctor_data: Dict) -> Dict:
-    """Create a new doctor"""
-    query = """
+def create_doctor(doctor_data: Dict, minimal: bool = False) -> Dict:
+    """Create a new doctor (minimal=True returns only the id)"""
+    returning = "id" if minimal else _DOCTOR_COLUMNS
+    query = f"""
         INSERT INTO doctors (id, name, email, phone, specialization, license_number, password_hash)
         VALUES (%(id)s, %(name)s, %(email)s, %(phone)s, %(specialization)s, %(licenseNumber)s, %(passwordHash)s)
-        RETURNING id, name, email, phone, specialization, license_number, created_at
+        RETURNING {returning}
     """
-    Database.execute(query, doctor_data, fetch="none")
-    return get_doctor(doctor_data['id'])
+    doctor = Database.execute(query, doctor_data, fetch="one")
+
+    get_all_doctors.cache_clear()
+    get_doctor.cache_clear()
+    get_doctor_by_email.cache_clear()
+    return doctor
 
 
 # ============================================================
@@ -224,18 +479,36 @@ def create_scan(scan_data: Dict, detections: List[Dict]) -> str:
     """Create a new scan with detections"""
     scan_id = scan_data['scanId']
 
-    # Insert scan
-    scan_query = """
-        INSERT INTO scans (
-            id, patient_id, status, upload_time, processing_time,
-            detected, confidence, risk_level, top_class,
-            file_size, image_format, image_width, image_height,
-            original_image_path, annotated_image_path
-        ) VALUES (
-            %(scanId)s, %(patientId)s, %(status)s, %(uploadTime)s, %(processingTime)s,
-            %(detected)s, %(confidence)s, %(riskLevel)s, %(topClass)s,
-            %(fileSize)s, %(format)s, %(width)s, %(height)s,
-            %(originalPath)s, %(annotatedPath)s
+    # Insert the scan and its detections with a single statement: the
+    # detections travel as one JSON array and are expanded server-side
+    query = """
+        WITH new_scan AS (
+            INSERT INTO scans (
+                id, patient_id, status, upload_time, processing_time,
+                detected, confidence, risk_level, top_class,
+                file_size, image_format, image_width, image_height,
+                original_image_path, annotated_image_path
+            ) VALUES (
+                %(scanId)s, %(patientId)s, %(status)s, %(uploadTime)s, %(processingTime)s,
+                %(detected)s, %(confidence)s, %(riskLevel)s, %(topClass)s,
+                %(fileSize)s, %(format)s, %(width)s, %(height)s,
+                %(originalPath)s, %(annotatedPath)s
+            )
+            RETURNING id
+        )
+        INSERT INTO detections (
+            scan_id, class_name, confidence,
+            bbox_x, bbox_y, bbox_width, bbox_height,
+            size_mm, shape, density
+        )
+        SELECT new_scan.id, d.class_name, d.confidence,
+               d.bbox_x, d.bbox_y, d.bbox_width, d.bbox_height,
+               d.size_mm, d.shape, d.density
+        FROM new_scan
+        CROSS JOIN json_to_recordset(%(detections)s) AS d(
+            class_name text, confidence numeric,
+            bbox_x numeric, bbox_y numeric, bbox_width numeric, bbox_height numeric,
+            size_mm numeric, shape text, density text
         )
     """
 
@@ -254,158 +527,270 @@ def create_scan(scan_data: Dict, detections: List[Dict]) -> str:
         'width': scan_data['metadata']['imageSize']['width'],
         'height': scan_data['metadata']['imageSize']['height'],
         'originalPath': scan_data.get('originalPath', ''),
-        'annotatedPath': scan_data.get('annotatedPath', '')
-    }
-
-    Database.execute(scan_query, params, fetch="none")
-
-    # Insert detections
-    if detections:
-        detection_query = """
-            INSERT INTO detections (
-                scan_id, class_name, confidence,
-                bbox_x, bbox_y, bbox_width, bbox_height,
-                size_mm, shape, density
-            ) VALUES (
-                %(scan_id)s, %(class)s, %(confidence)s,
-                %(x)s, %(y)s, %(width)s, %(height)s,
-                %(size_mm)s, %(shape)s, %(density)s
-            )
-        """
-
-        for det in detections:
-            det_params = {
-                'scan_id': scan_id,
-                'class': det['class'],
+        'annotatedPath': scan_data.get('annotatedPath', ''),
+        'detections': Json([
+            {
+                'class_name': det['class'],
                 'confidence': det['confidence'],
-                'x': det['boundingBox']['x'],
-                'y': det['boundingBox']['y'],
-                'width': det['boundingBox']['width'],
-                'height': det['boundingBox']['height'],
+                'bbox_x': det['boundingBox']['x'],
+                'bbox_y': det['boundingBox']['y'],
+                'bbox_width': det['boundingBox']['width'],
+                'bbox_height': det['boundingBox']['height'],
                 'size_mm': det['characteristics']['size_mm'],
                 'shape': det['characteristics']['shape'],
                 'density': det['characteristics']['density']
             }
-            Database.execute(detection_query, det_params, fetch="none")
+            for det in detections or []
+        ], dumps=_json_dumps)
+    }
 
+    Database.execute(query, params, fetch="none")
+
+    get_scan.cache_pop(scan_id)
     return scan_id
 
 
+# Below this many rows a multi-row INSERT beats the CSV encoding cost of COPY
+_BULK_COPY_THRESHOLD = 10_000
+
+
+def _bulk_insert(cursor, table: str, columns: Sequence[str], rows: Sequence[Sequence]) -> None:
+    """Insert rows with execute_values (small batches) or COPY (large ones)"""
+    if len(rows) <= _BULK_COPY_THRESHOLD:
+        execute_values(cursor, f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s", rows, page_size=1000)
+        return
+
+    buffer = io.StringIO()
+    # Strings are quoted so '' stays an empty string; unquoted empty fields are NULL
+    csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def bulk_create_scans(scans: Iterable[Tuple[Dict, List[Dict]]]) -> int:
+    """
+    Bulk-load (scan_data, detections) pairs with execute_values or COPY
+
+    For seed/migration jobs; API requests go through create_scan.
+    Everything is loaded in one transaction.
+
+    Returns:
+        Number of scans loaded
+    """
+    scan_rows = []
+    detection_rows = []
+
+    for scan_data, detections in scans:
+        scan_id = scan_data['scanId']
+        results = scan_data['results']
+        metadata = scan_data['metadata']
+        scan_rows.append((
+            scan_id,
+            scan_data.get('patientId', 'unknown'),
+            scan_data['status'],
+            scan_data['uploadTime'],
+            scan_data['processingTime'],
+            results['detected'],
+            results['confidence'],
+            results['riskLevel'],
+            results['topClass'],
+            metadata['fileSize'],
+            metadata['format'],
+            metadata['imageSize']['width'],
+            metadata['imageSize']['height'],
+            scan_data.get('originalPath', ''),
+            scan_data.get('annotatedPath', '')
+        ))
+        detection_rows.extend(
+            (
+                scan_id,
+                det['class'],
+                det['confidence'],
+                det['boundingBox']['x'],
+                det['boundingBox']['y'],
+                det['boundingBox']['width'],
+                det['boundingBox']['height'],
+                det['characteristics']['size_mm'],
+                det['characteristics']['shape'],
+                det['characteristics']['density']
+            )
+            for det in detections or []
+        )
+
+    with Database.get_connection() as conn:
+        cursor = conn.cursor()
+        _bulk_insert(cursor, "scans", (
+            'id', 'patient_id', 'status', 'upload_time', 'processing_time',
+            'detected', 'confidence', 'risk_level', 'top_class',
+            'file_size', 'image_format', 'image_width', 'image_height',
+            'original_image_path', 'annotated_image_path'
+        ), scan_rows)
+        if detection_rows:
+            _bulk_insert(cursor, "detections", (
+                'scan_id', 'class_name', 'confidence',
+                'bbox_x', 'bbox_y', 'bbox_width', 'bbox_height',
+                'size_mm', 'shape', 'density'
+            ), detection_rows)
+
+    logger.info("Bulk-loaded %s scans (%s detections)", len(scan_rows), len(detection_rows))
+    return len(scan_rows)
+
+
+@_ttl_cache(ttl=30)
 def get_scan(scan_id: str) -> Optional[Dict]:
     """Get scan by ID with detections"""
-    scan_query = "SELECT * FROM scans WHERE id = %s"
-    scan = Database.execute(scan_query, (scan_id,), fetch="one")
-
-    if not scan:
-        return None
-
-    # Get detections
-    detections_query = "SELECT * FROM detections WHERE scan_id = %s"
-    detections = Database.execute(detections_query, (scan_id,), fetch="all")
-
-    # Format response
-    upload_time = scan['upload_time']
-    if isinstance(upload_time, str):
-        upload_time_str = upload_time
-    else:
-        upload_time_str = upload_time.isoformat()
-
-    return {
-        'scanId': scan['id'],
-        'patientId': scan.get('patient_id'),
-        'status': scan['status'],
-        'uploadTime': upload_time_str,
-        'processingTime': scan['processing_time'],
-        'results': {
-            'detected': scan['detected'],
-            'confidence': scan['confidence'],
-            'riskLevel': scan['risk_level'],
-            'topClass': scan['top_class'],
-            'detections': [
-                {
-                    'class': d['class_name'],
-                    'confidence': d['confidence'],
-                    'boundingBox': {
-                        'x': d['bbox_x'],
-                        'y': d['bbox_y'],
-                        'width': d['bbox_width'],
-                        'height': d['bbox_height']
-                    },
-                    'characteristics': {
-                        'size_mm': d['size_mm'],
-                        'shape': d['shape'],
-                        'density': d['density']
-                    }
-                }
-                for d in detections
-            ]
-        },
-        'metadata': {
-            'imageSize': {
-                'width': scan['image_width'],
-                'height': scan['image_height']
-            },
-            'fileSize': scan['file_size'],
-            'format': scan['image_format']
-        },
-        'originalImagePath': scan.get('original_image_path'),
-        'annotatedImagePath': scan.get('annotated_image_path')
-    }
+    # PostgreSQL builds the whole API payload (detections included), so the
+    # scan comes back as one ready-made dict in one round trip
+    query = """
+        SELECT json_build_object(
+            'scanId', s.id,
+            'patientId', s.patient_id,
+            'status', s.status,
+            'uploadTime', s.upload_time,
+            'processingTime', s.processing_time,
+            'results', json_build_object(
+                'detected', s.detected,
+                'confidence', s.confidence,
+                'riskLevel', s.risk_level,
+                'topClass', s.top_class,
+                'detections', COALESCE((
+                    SELECT json_agg(
+                        json_build_object(
+                            'class', d.class_name,
+                            'confidence', d.confidence,
+                            'boundingBox', json_build_object(
+                                'x', d.bbox_x, 'y', d.bbox_y,
+                                'width', d.bbox_width, 'height', d.bbox_height
+                            ),
+                            'characteristics', json_build_object(
+                                'size_mm', d.size_mm, 'shape', d.shape, 'density', d.density
+                            )
+                        )
+                    )
+                    FROM detections d
+                    WHERE d.scan_id = s.id
+                ), '[]'::json)
+            ),
+            'metadata', json_build_object(
+                'imageSize', json_build_object('width', s.image_width, 'height', s.image_height),
+                'fileSize', s.file_size,
+                'format', s.image_format
+            ),
+            'originalImagePath', s.original_image_path,
+            'annotatedImagePath', s.annotated_image_path
+        ) AS payload
+        FROM scans s
+        WHERE s.id = $1
+    """
+    row = Database.execute_prepared("get_scan", query, (scan_id,))
+    return row['payload'] if row else None
 
 
-def get_patient_scans(patient_id: str) -> List[Dict]:
-    """Get all scans for a patient"""
+def get_scan_detections(scan_id: str) -> Optional[List[Dict]]:
+    """Get only a scan's detections in the API shape (None if the scan doesn't exist)"""
     query = """
+        SELECT COALESCE((
+            SELECT json_agg(
+                json_build_object(
+                    'class', d.class_name,
+                    'confidence', d.confidence,
+                    'boundingBox', json_build_object(
+                        'x', d.bbox_x, 'y', d.bbox_y,
+                        'width', d.bbox_width, 'height', d.bbox_height
+                    ),
+                    'characteristics', json_build_object(
+                        'size_mm', d.size_mm, 'shape', d.shape, 'density', d.density
+                    )
+                )
+            )
+            FROM detections d
+            WHERE d.scan_id = s.id
+        ), '[]'::json) AS detections
+        FROM scans s
+        WHERE s.id = $1
+    """
+    row = Database.execute_prepared("get_scan_detections", query, (scan_id,))
+    return row['detections'] if row else None
+
+
+def get_scan_summary(scan_id: str) -> Optional[Dict]:
+    """Get a scan's summary columns only (no detections join)"""
+    query = """
+        SELECT id, patient_id, upload_time, status, risk_level, confidence, detected
+        FROM scans
+        WHERE id = $1
+    """
+    return Database.execute_prepared("get_scan_summary", query, (scan_id,))
+
+
+def get_patient_scans(patient_id: str, limit: int = 100, offset: int = 0,
+                      before: Optional[Tuple[Any, str]] = None) -> List[Dict]:
+    """
+    Get a page of scans for a patient (newest first)
+
+    Pass `before` as the (upload_time, id) of the last row of the previous
+    page for keyset pagination; unlike OFFSET it doesn't re-scan skipped rows.
+    """
+    keyset = "AND (upload_time, id) < (%s, %s)" if before else ""
+    query = f"""
         SELECT id, upload_time, status, risk_level, confidence, detected
         FROM scans
-        WHERE patient_id = %s
-        ORDER BY upload_time DESC
+        WHERE patient_id = %s {keyset}
+        ORDER BY upload_time DESC, id DESC
+        LIMIT %s OFFSET %s
     """
-    return Database.execute(query, (patient_id,), fetch="all")
+    params = (patient_id, *before, limit, offset) if before else (patient_id, limit, offset)
+    return Database.execute_tuples(query, params)
 
 
 def delete_scan(scan_id: str) -> bool:
-    """Delete a scan (cascade deletes detections and comments)"""
-    query = "DELETE FROM scans WHERE id = %s"
-    Database.execute(query, (scan_id,), fetch="none")
-    return True
+    """Delete a scan (cascade deletes detections and comments); False if it didn't exist"""
+    query = "DELETE FROM scans WHERE id = %s RETURNING id"
+    deleted = Database.execute(query, (scan_id,), fetch="one") is not None
+
+    get_scan.cache_pop(scan_id)
+    return deleted
 
 
 # ============================================================
 # SCAN COMMENTS DATABASE FUNCTIONS
 # ============================================================
 
+_COMMENT_COLUMNS = """
+    id, scan_id, user_id, user_role, user_name, comment_text,
+    parent_comment_id, created_at, updated_at
+"""
+
+
 def create_scan_comment(comment_data: Dict) -> Dict:
     """Create a new scan comment"""
-    query = """
+    query = f"""
         INSERT INTO scan_comments (scan_id, user_id, user_role, user_name, comment_text, parent_comment_id)
         VALUES (%(scan_id)s, %(user_id)s, %(user_role)s, %(user_name)s, %(comment_text)s, %(parent_comment_id)s)
-        RETURNING *
-    """
-    Database.execute(query, comment_data, fetch="none")
-
-    # Return the created comment
-    get_query = """
-        SELECT * FROM scan_comments
-        WHERE scan_id = %(scan_id)s AND user_id = %(user_id)s
-        ORDER BY created_at DESC LIMIT 1
+        RETURNING {_COMMENT_COLUMNS}
     """
-    return Database.execute(get_query, comment_data, fetch="one")
+    return Database.execute(query, comment_data, fetch="one")
 
 
-def get_scan_comments(scan_id: str) -> List[Dict]:
-    """Get all comments for a scan"""
-    query = "SELECT * FROM scan_comments WHERE scan_id = %s ORDER BY created_at ASC"
-    return Database.execute(query, (scan_id,), fetch="all")
+def get_scan_comments(scan_id: str, limit: int = 100, offset: int = 0) -> List[Dict]:
+    """Get a page of comments for a scan (oldest first)"""
+    query = f"""
+        SELECT {_COMMENT_COLUMNS}
+        FROM scan_comments
+        WHERE scan_id = %s
+        ORDER BY created_at ASC
+        LIMIT %s OFFSET %s
+    """
+    return Database.execute_tuples(query, (scan_id, limit, offset))
 
 
 def update_scan_comment(comment_id: int, comment_text: str) -> Optional[Dict]:
     """Update a comment"""
-    query = """
+    query = f"""
         UPDATE scan_comments
         SET comment_text = %s, updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
-        RETURNING *
+        RETURNING {_COMMENT_COLUMNS}
     """
     return Database.execute(query, (comment_text, comment_id), fetch="one")
 
@@ -421,142 +806,164 @@ def delete_scan_comment(comment_id: int) -> bool:
 # APPOINTMENT DATABASE FUNCTIONS
 # ============================================================
 
-def _map_appointment_fields(row: Dict) -> Dict:
-    """Map database appointment fields to API response format"""
-    return {
-        'id': row['id'],
-        'patientId': row['patient_id'],
-        'doctorId': row['doctor_id'],
-        'doctorName': row['doctor_name'],
-        'date': row['appointment_date'],
-        'time': row['appointment_time'],
-        'type': row['type'],
-        'status': row['status'],
-        'notes': row['notes'],
-        'created_at': row['created_at'],
-        'updated_at': row['updated_at']
-    }
+# Appointment columns aliased to the API response field names
+_APPOINTMENT_COLUMNS = """
+    id, patient_id AS "patientId", doctor_id AS "doctorId", doctor_name AS "doctorName",
+    appointment_date AS "date", appointment_time AS "time",
+    type, status, notes, created_at, updated_at
+"""
 
 
-def create_appointment(appointment_data: Dict) -> Dict:
-    """Create a new appointment"""
-    query = """
+def create_appointment(appointment_data: Dict, minimal: bool = False) -> Dict:
+    """Create a new appointment (minimal=True returns only the id)"""
+    query = f"""
         INSERT INTO appointments (
             id, patient_id, doctor_id, doctor_name,
             appointment_date, appointment_time, type, status, notes
         ) VALUES (
             %(id)s, %(patientId)s, %(doctorId)s, %(doctorName)s,
             %(date)s, %(time)s, %(type)s, %(status)s, %(notes)s
-        ) RETURNING *
+        ) RETURNING {"id" if minimal else _APPOINTMENT_COLUMNS}
     """
-    Database.execute(query, appointment_data, fetch="none")
-
-    get_query = "SELECT * FROM appointments WHERE id = %s"
-    row = Database.execute(get_query, (appointment_data['id'],), fetch="one")
-    return _map_appointment_fields(row)
+    return Database.execute(query, appointment_data, fetch="one")
 
 
-def get_patient_appointments(patient_id: str) -> List[Dict]:
-    """Get all appointments for a patient"""
-    query = """
-        SELECT * FROM appointments
+def get_patient_appointments(patient_id: str, limit: int = 100, offset: int = 0) -> List[Dict]:
+    """Get a page of appointments for a patient (newest first)"""
+    query = f"""
+        SELECT {_APPOINTMENT_COLUMNS}
+        FROM appointments
         WHERE patient_id = %s
         ORDER BY appointment_date DESC, appointment_time DESC
+        LIMIT %s OFFSET %s
     """
-    rows = Database.execute(query, (patient_id,), fetch="all")
-    return [_map_appointment_fields(row) for row in rows]
+    return Database.execute_tuples(query, (patient_id, limit, offset))
 
 
-def get_doctor_appointments(doctor_id: str) -> List[Dict]:
-    """Get all appointments for a doctor"""
-    query = """
-        SELECT * FROM appointments
+def get_doctor_appointments(doctor_id: str, limit: int = 100, offset: int = 0) -> List[Dict]:
+    """Get a page of appointments for a doctor (newest first)"""
+    query = f"""
+        SELECT {_APPOINTMENT_COLUMNS}
+        FROM appointments
         WHERE doctor_id = %s
         ORDER BY appointment_date DESC, appointment_time DESC
+        LIMIT %s OFFSET %s
     """
-    rows = Database.execute(query, (doctor_id,), fetch="all")
-    return [_map_appointment_fields(row) for row in rows]
+    return Database.execute_tuples(query, (doctor_id, limit, offset))
 
 
 def update_appointment(appointment_id: str, updates: Dict) -> Optional[Dict]:
-    """Update an appointment"""
-    set_clauses = []
-    params = {}
-
-    allowed_fields = ['status', 'notes', 'appointment_date', 'appointment_time']
-    for field in allowed_fields:
-        if field in updates:
-            set_clauses.append(f"{field} = %({field})s")
-            params[field] = updates[field]
+    """Update an appointment; None if it doesn't exist"""
+    columns = tuple(field for field in _APPOINTMENT_UPDATE_FIELDS if field in updates)
 
-    if not set_clauses:
+    if not columns:
         return get_appointment(appointment_id)
 
+    params = {field: updates[field] for field in columns}
     params['id'] = appointment_id
-    query = f"""
-        UPDATE appointments
-        SET {', '.join(set_clauses)}
-        WHERE id = %(id)s
-        RETURNING *
-    """
-    row = Database.execute(query, params, fetch="one")
-    return _map_appointment_fields(row) if row else None
+    query = _build_update_query("appointments", columns, _APPOINTMENT_COLUMNS)
+
+    return Database.execute(query, params, fetch="one")
 
 
 def get_appointment(appointment_id: str) -> Optional[Dict]:
     """Get appointment by ID"""
-    query = "SELECT * FROM appointments WHERE id = %s"
-    row = Database.execute(query, (appointment_id,), fetch="one")
-    return _map_appointment_fields(row) if row else None
+    query = f"""
+        SELECT {_APPOINTMENT_COLUMNS}
+        FROM appointments
+        WHERE id = $1
+    """
+    return Database.execute_prepared("get_appointment", query, (appointment_id,))
 
 
 def delete_appointment(appointment_id: str) -> bool:
-    """Delete an appointment"""
-    query = "DELETE FROM appointments WHERE id = %s"
-    Database.execute(query, (appointment_id,), fetch="none")
-    return True
+    """Delete an appointment; False if it didn't exist"""
+    query = "DELETE FROM appointments WHERE id = %s RETURNING id"
+    return Database.execute(query, (appointment_id,), fetch="one") is not None
 
 
 # ============================================================
 # MESSAGE DATABASE FUNCTIONS
 # ============================================================
 
+_MESSAGE_COLUMNS = """
+    id, sender_id, sender_name, sender_role, receiver_id, receiver_name,
+    content, read, created_at
+"""
+
+
 def create_message(message_data: Dict) -> Dict:
     """Create a new message"""
-    query = """
+    query = f"""
         INSERT INTO messages (
             id, sender_id, sender_name, sender_role,
             receiver_id, receiver_name, content
         ) VALUES (
             %(id)s, %(senderId)s, %(senderName)s, %(senderRole)s,
             %(receiverId)s, %(receiverName)s, %(content)s
-        ) RETURNING *
+        ) RETURNING {_MESSAGE_COLUMNS}
     """
-    Database.execute(query, message_data, fetch="none")
+    return Database.execute(query, message_data, fetch="one")
+
 
-    get_query = "SELECT * FROM messages WHERE id = %s"
-    return Database.execute(get_query, (message_data['id'],), fetch="one")
+def create_messages_bulk(messages: List[Dict]) -> List[Dict]:
+    """Create many messages with multi-row INSERTs"""
+    query = f"""
+        INSERT INTO messages (
+            id, sender_id, sender_name, sender_role,
+            receiver_id, receiver_name, content
+        ) VALUES %s
+        RETURNING {_MESSAGE_COLUMNS}
+    """
+    template = """(
+        %(id)s, %(senderId)s, %(senderName)s, %(senderRole)s,
+        %(receiverId)s, %(receiverName)s, %(content)s
+    )"""
+    return Database.execute_many(query, messages, template=template, page_size=500, fetch=True)
 
 
-def get_user_messages(user_id: str) -> List[Dict]:
-    """Get all messages for a user"""
-    query = """
-        SELECT * FROM messages
-        WHERE sender_id = %s OR receiver_id = %s
+def get_user_messages(user_id: str, limit: int = 100, offset: int = 0) -> List[Dict]:
+    """Get a page of messages for a user (newest first)"""
+    # Two index-friendly branches instead of "sender_id = %s OR receiver_id = %s";
+    # each branch only needs its first (limit + offset) rows
+    query = f"""
+        (
+            SELECT {_MESSAGE_COLUMNS}
+            FROM messages
+            WHERE sender_id = %(user_id)s
+            ORDER BY created_at DESC
+            LIMIT %(window)s
+        )
+        UNION ALL
+        (
+            SELECT {_MESSAGE_COLUMNS}
+            FROM messages
+            WHERE receiver_id = %(user_id)s AND sender_id IS DISTINCT FROM %(user_id)s
+            ORDER BY created_at DESC
+            LIMIT %(window)s
+        )
         ORDER BY created_at DESC
+        LIMIT %(limit)s OFFSET %(offset)s
     """
-    return Database.execute(query, (user_id, user_id), fetch="all")
+    params = {'user_id': user_id, 'window': limit + offset, 'limit': limit, 'offset': offset}
+    return Database.execute_tuples(query, params)
 
 
 def mark_message_read(message_id: str) -> Optional[Dict]:
     """Mark a message as read"""
-    query = """
+    query = f"""
         UPDATE messages
         SET read = TRUE
-        WHERE id = %s
-        RETURNING *
+        WHERE id = $1
+        RETURNING {_MESSAGE_COLUMNS}
     """
-    return Database.execute(query, (message_id,), fetch="one")
+    return Database.execute_prepared("mark_message_read", query, (message_id,))
+
+
+def mark_messages_read(message_ids: List[str]) -> int:
+    """Mark several messages as read in one statement; returns how many were updated"""
+    query = "UPDATE messages SET read = TRUE WHERE id = ANY(%s) AND NOT read RETURNING id"
+    return len(Database.execute(query, (message_ids,), fetch="all"))
 
 
 def delete_message(message_id: str) -> bool:
@@ -4,7 +4,7 @@ Lung Cancer Detection System with YOLOv12 Integration
 
 Main application entry point with:
 - FastAPI app initialization
-- CORS middleware
+- CORS and GZip middleware
 - Static file serving
 - Router registration
 - Database connection pooling
@@ -14,12 +14,16 @@ Main application entry point with:
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from pathlib import Path
 import logging
 
 from app.config import settings
 from app.database import Database
 from app.services.yolo_service import yolo_service
+from app.routers import health, auth, patients, doctors, scans, appointments, messages
 
 # Configure logging
 logging.basicConfig(
@@ -49,12 +53,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger.info(f"✅ CORS enabled for origins: {settings.ALLOWED_ORIGINS}")
+logger.debug("CORS enabled for origins: %s", settings.ALLOWED_ORIGINS)
+
+# ============================================================
+# COMPRESSION MIDDLEWARE
+# ============================================================
+
+# List endpoints return large JSON arrays; small bodies aren't worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # ============================================================
 # STATIC FILE SERVING
 # ============================================================
 
+# Upload directories must exist before StaticFiles checks them
+settings.ensure_dirs()
+
 # Mount uploads directory for serving images
 app.mount(
     "/uploads",
@@ -62,21 +76,18 @@ app.mount(
     name="uploads"
 )
 
-logger.info(f"✅ Static files mounted at /uploads → {settings.UPLOAD_DIR}")
+logger.debug("Static files mounted at /uploads → %s", settings.UPLOAD_DIR)
 
 # Mount React frontend (if build directory exists)
-import os
-from pathlib import Path
-
 build_dir = Path("build")
-if build_dir.exists() and build_dir.is_dir():
+if build_dir.is_dir():
     # Serve React static files (CSS, JS, images)
     app.mount(
         "/static",
         StaticFiles(directory=str(build_dir / "static")),
         name="static"
     )
-    logger.info(f"✅ Frontend static files mounted at /static → {build_dir / 'static'}")
+    logger.debug("Frontend static files mounted at /static → %s", build_dir / "static")
 
 # ============================================================
 # STARTUP & SHUTDOWN EVENTS
@@ -118,11 +129,25 @@ async def shutdown_event():
 
 
 # ============================================================
-# ROUTER REGISTRATION
+# REGISTER ROUTERS
 # ============================================================
 
-# Import routers
-from app.routers import health, auth, patients, doctors, scans, appointments, messages
+# (router, prefix, tags); health checks live at root level
+ROUTERS = (
+    (health.router, "", ["Health"]),
+    (auth.router, "/api/v1/auth", ["Authentication"]),
+    (patients.router, "/api/v1/patients", ["Patients"]),
+    (doctors.router, "/api/v1/doctors", ["Doctors"]),
+    (scans.router, "/api/v1/scans", ["Scans"]),
+    (appointments.router, "/api/v1/appointments", ["Appointments"]),
+    (messages.router, "/api/v1/messages", ["Messages"]),
+)
+
+for router, prefix, tags in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=tags)
+
+logger.debug("All routers registered")
+
 
 # ============================================================
 # ROOT ENDPOINT
@@ -130,10 +155,8 @@ from app.routers import health, auth, patients, doctors, scans, appointments, me
 
 # If frontend build exists, serve it at root
 # Otherwise, show API information
-build_dir = Path("build")
-if build_dir.exists() and (build_dir / "index.html").exists():
-    from fastapi.responses import FileResponse
-
+# (registered after the API routers so the catch-all can't shadow them)
+if (build_dir / "index.html").exists():
     @app.get("/")
     async def serve_frontend():
         """Serve React frontend"""
@@ -174,34 +197,6 @@ else:
     logger.info("ℹ️  Frontend build not found - API-only mode")
 
 
-# ============================================================
-# REGISTER ROUTERS
-# ============================================================
-
-# Health checks (no prefix - at root level)
-app.include_router(health.router, tags=["Health"])
-
-# Authentication
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-
-# Patients
-app.include_router(patients.router, prefix="/api/v1/patients", tags=["Patients"])
-
-# Doctors
-app.include_router(doctors.router, prefix="/api/v1/doctors", tags=["Doctors"])
-
-# Scans (CT scan upload and analysis)
-app.include_router(scans.router, prefix="/api/v1/scans", tags=["Scans"])
-
-# Appointments
-app.include_router(appointments.router, prefix="/api/v1/appointments", tags=["Appointments"])
-
-# Messages
-app.include_router(messages.router, prefix="/api/v1/messages", tags=["Messages"])
-
-logger.info("✅ All routers registered successfully")
-
-
 # ============================================================
 # APPLICATION ENTRY POINT
 # ============================================================
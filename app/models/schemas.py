@@ -3,7 +3,7 @@ Pydantic Schemas for PneumAI API
 Request and response models for type-safe API operations
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, field_validator, validator
 from typing import Optional, List
 from datetime import datetime, date, time
 from enum import Enum
@@ -36,6 +36,11 @@ class RiskLevel(str, Enum):
     HIGH = "high"
 
 
+def _normalize_email(value):
+    """Strip and lowercase an email before EmailStr validation"""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
 # ============================================================
 # AUTHENTICATION SCHEMAS
 # ============================================================
@@ -46,6 +51,8 @@ class LoginRequest(BaseModel):
     password: str = Field(..., min_length=8)
     role: UserRole
 
+    _lower_email = field_validator('email', mode='before')(_normalize_email)
+
 
 class LoginResponse(BaseModel):
     """Login response schema"""
@@ -80,7 +87,7 @@ class PatientBase(BaseModel):
 
 class PatientCreate(PatientBase):
     """Schema for creating a patient"""
-    pass
+    _lower_email = field_validator('email', mode='before')(_normalize_email)
 
 
 class PatientUpdate(BaseModel):
@@ -92,9 +99,13 @@ class PatientUpdate(BaseModel):
     gender: Optional[str] = None
     medicalHistory: Optional[str] = None
 
+    _lower_email = field_validator('email', mode='before')(_normalize_email)
+
 
 class PatientResponse(PatientBase):
-    """Patient response schema"""
+    """Patient response schema (also reads the snake_case keys of database rows)"""
+    dateOfBirth: Optional[date] = Field(None, validation_alias=AliasChoices('dateOfBirth', 'date_of_birth'))
+    medicalHistory: Optional[str] = Field(None, validation_alias=AliasChoices('medicalHistory', 'medical_history'))
     id: str
     created_at: datetime
     updated_at: datetime
@@ -122,6 +133,8 @@ class DoctorCreate(DoctorBase):
     """Schema for creating/registering a doctor"""
     password: str = Field(..., min_length=8)
 
+    _lower_email = field_validator('email', mode='before')(_normalize_email)
+
 
 class DoctorResponse(DoctorBase):
     """Doctor response schema (no password)"""
@@ -296,6 +309,11 @@ class MessageCreate(BaseModel):
     content: str = Field(..., min_length=1, max_length=10000)
 
 
+class MessagesReadRequest(BaseModel):
+    """Schema for marking several messages as read"""
+    messageIds: List[str] = Field(..., min_length=1, max_length=1000)
+
+
 class MessageResponse(BaseModel):
     """Message response schema"""
     id: str
@@ -3,9 +3,11 @@ Appointments Router for PneumAI
 Appointment scheduling and management
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi.responses import Response
+from typing import List, Optional
 import logging
+import orjson
 
 from app.models.schemas import (
     AppointmentCreate,
@@ -21,7 +23,7 @@ from app.database import (
     update_appointment,
     delete_appointment
 )
-from app.utils.helpers import generate_appointment_id
+from app.utils.helpers import generate_appointment_id, prefers_minimal_return
 from app.utils.security import sanitize_input
 
 logger = logging.getLogger(__name__)
@@ -30,30 +32,40 @@ router = APIRouter()
 
 
 @router.get("/patient/{patient_id}", response_model=List[AppointmentResponse])
-async def get_appointments_for_patient(patient_id: str):
+async def get_appointments_for_patient(
+    patient_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """
     Get all appointments for a patient
 
-    Returns list of appointments sorted by date (newest first)
+    Returns a page of appointments sorted by date (newest first)
     """
     try:
-        appointments = get_patient_appointments(patient_id)
-        return appointments
+        appointments = get_patient_appointments(patient_id, limit=limit, offset=offset)
+        # Rows are already in the response shape; skip re-validating them
+        return Response(content=orjson.dumps(appointments), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching appointments for patient {patient_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch appointments")
 
 
 @router.get("/doctor/{doctor_id}", response_model=List[AppointmentResponse])
-async def get_appointments_for_doctor(doctor_id: str):
+async def get_appointments_for_doctor(
+    doctor_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """
     Get all appointments for a doctor
 
-    Returns list of appointments sorted by date (newest first)
+    Returns a page of appointments sorted by date (newest first)
     """
     try:
-        appointments = get_doctor_appointments(doctor_id)
-        return appointments
+        appointments = get_doctor_appointments(doctor_id, limit=limit, offset=offset)
+        # Rows are already in the response shape; skip re-validating them
+        return Response(content=orjson.dumps(appointments), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching appointments for doctor {doctor_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch appointments")
@@ -82,11 +94,15 @@ async def get_appointment_by_id(appointment_id: str):
 
 @router.post("", response_model=AppointmentResponse, status_code=201)
 @router.post("/", response_model=AppointmentResponse, status_code=201)
-async def create_new_appointment(appointment: AppointmentCreate):
+async def create_new_appointment(
+    appointment: AppointmentCreate,
+    prefer: Optional[str] = Header(None)
+):
     """
     Create a new appointment
 
-    Generates unique appointment ID and schedules appointment
+    Generates unique appointment ID and schedules appointment.
+    With "Prefer: return=minimal" only the new ID is returned.
     """
     try:
         # Generate appointment ID
@@ -109,10 +125,18 @@ async def create_new_appointment(appointment: AppointmentCreate):
         }
 
         # Create appointment
-        created_appointment = create_appointment(appointment_data)
+        minimal = prefers_minimal_return(prefer)
+        created_appointment = create_appointment(appointment_data, minimal=minimal)
 
         logger.info(f"✅ Appointment created: {appointment_id} - {appointment.date} at {appointment.time}")
 
+        if minimal:
+            return Response(
+                content=orjson.dumps({"id": appointment_id}),
+                status_code=201,
+                media_type="application/json",
+                headers={"Preference-Applied": "return=minimal"}
+            )
         return created_appointment
 
     except Exception as e:
@@ -128,11 +152,6 @@ async def update_appointment_info(appointment_id: str, updates: AppointmentUpdat
     Can update status, notes, date, or time
     """
     try:
-        # Check if appointment exists
-        existing_appointment = get_appointment(appointment_id)
-        if not existing_appointment:
-            raise HTTPException(status_code=404, detail=f"Appointment not found: {appointment_id}")
-
         # Prepare update data
         update_data = {}
         if updates.status:
@@ -144,8 +163,10 @@ async def update_appointment_info(appointment_id: str, updates: AppointmentUpdat
         if updates.time:
             update_data['appointment_time'] = updates.time.isoformat()
 
-        # Update appointment
+        # Update appointment (RETURNING doubles as the existence check)
         updated_appointment = update_appointment(appointment_id, update_data)
+        if not updated_appointment:
+            raise HTTPException(status_code=404, detail=f"Appointment not found: {appointment_id}")
 
         logger.info(f"✅ Appointment updated: {appointment_id}")
 
@@ -166,14 +187,10 @@ async def cancel_appointment(appointment_id: str):
     Removes appointment from the system
     """
     try:
-        # Check if appointment exists
-        existing_appointment = get_appointment(appointment_id)
-        if not existing_appointment:
+        # Delete appointment (RETURNING doubles as the existence check)
+        if not delete_appointment(appointment_id):
             raise HTTPException(status_code=404, detail=f"Appointment not found: {appointment_id}")
 
-        # Delete appointment
-        delete_appointment(appointment_id)
-
         logger.info(f"✅ Appointment cancelled: {appointment_id}")
 
         return MessageOnlyResponse(message=f"Appointment {appointment_id} cancelled successfully")
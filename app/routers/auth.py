@@ -5,19 +5,77 @@ Login, logout, and session management
 
 from fastapi import APIRouter, HTTPException, Header
 from typing import Optional
+import asyncio
 import logging
 
 from app.models.schemas import LoginRequest, LoginResponse, SessionInfo
-from app.database import get_doctor_by_email
-from app.utils.security import verify_password
+from app.database import get_doctor_credentials
+from app.utils.security import verify_password, verify_dummy_password
+from app.services.session_store import session_store
 from app.utils.helpers import generate_session_token
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory session storage (for MVP - replace with Redis in production)
-active_sessions = {}
+
+# Account lookup per role; roles without an entry can't log in yet
+# (patients need a password_hash column, admins an accounts table)
+ROLE_LOOKUPS = {
+    "doctor": get_doctor_credentials,
+}
+
+
+async def _authenticate(role: str, account: Optional[dict], password: str) -> LoginResponse:
+    """Verify credentials for a looked-up account and mint its session"""
+    if not account:
+        # bcrypt runs in a worker thread so the event loop keeps serving
+        await asyncio.to_thread(verify_dummy_password, password)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid email or password for this account type"
+        )
+
+    # Verify password
+    if not account.get('password_hash'):
+        raise HTTPException(
+            status_code=401,
+            detail="Account not configured. Please contact administrator."
+        )
+
+    if not await asyncio.to_thread(verify_password, password, account['password_hash']):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid email or password for this account type"
+        )
+
+    # Check if account is active
+    if not account.get('is_active', True):
+        raise HTTPException(
+            status_code=403,
+            detail="Account is inactive. Please contact administrator."
+        )
+
+    # Generate session token
+    session_token = generate_session_token()
+
+    # Store session
+    await session_store.create(session_token, {
+        "user_id": account['id'],
+        "name": account['name'],
+        "email": account['email'],
+        "role": role
+    })
+
+    logger.info(f"✅ {role.capitalize()} login successful: {account['email']}")
+
+    return LoginResponse(
+        user_id=account['id'],
+        name=account['name'],
+        email=account['email'],
+        role=role,
+        session_token=session_token
+    )
 
 
 @router.post("/login", response_model=LoginResponse)
@@ -31,77 +89,16 @@ async def login(credentials: LoginRequest):
     - Admin login (future implementation)
     """
     try:
-        # Validate role
-        if credentials.role.value not in ["doctor", "patient", "admin"]:
-            raise HTTPException(status_code=400, detail="Invalid role")
-
-        # Doctor login
-        if credentials.role.value == "doctor":
-            doctor = get_doctor_by_email(credentials.email)
-
-            if not doctor:
-                raise HTTPException(
-                    status_code=401,
-                    detail="Invalid email or password for this account type"
-                )
-
-            # Verify password
-            if not doctor.get('password_hash'):
-                raise HTTPException(
-                    status_code=401,
-                    detail="Account not configured. Please contact administrator."
-                )
-
-            if not verify_password(credentials.password, doctor['password_hash']):
-                raise HTTPException(
-                    status_code=401,
-                    detail="Invalid email or password for this account type"
-                )
-
-            # Check if account is active
-            if not doctor.get('is_active', True):
-                raise HTTPException(
-                    status_code=403,
-                    detail="Account is inactive. Please contact administrator."
-                )
-
-            # Generate session token
-            session_token = generate_session_token()
-
-            # Store session
-            active_sessions[session_token] = {
-                "user_id": doctor['id'],
-                "name": doctor['name'],
-                "email": doctor['email'],
-                "role": "doctor"
-            }
-
-            logger.info(f"✅ Doctor login successful: {doctor['email']}")
-
-            return LoginResponse(
-                user_id=doctor['id'],
-                name=doctor['name'],
-                email=doctor['email'],
-                role="doctor",
-                session_token=session_token
-            )
+        role = credentials.role.value
+        lookup = ROLE_LOOKUPS.get(role)
 
-        # Patient login (placeholder - implement when patients have password_hash)
-        elif credentials.role.value == "patient":
-            # TODO: Implement patient authentication
-            # For now, return error
+        if lookup is None:
             raise HTTPException(
                 status_code=501,
-                detail="Patient login not yet implemented"
+                detail=f"{role.capitalize()} login not yet implemented"
             )
 
-        # Admin login (placeholder)
-        elif credentials.role.value == "admin":
-            # TODO: Implement admin authentication
-            raise HTTPException(
-                status_code=501,
-                detail="Admin login not yet implemented"
-            )
+        return await _authenticate(role, lookup(credentials.email), credentials.password)
 
     except HTTPException:
         raise
@@ -124,9 +121,8 @@ async def logout(authorization: Optional[str] = Header(None)):
         # Extract token (support both "Bearer token" and just "token")
         token = authorization.replace("Bearer ", "").strip()
 
-        if token in active_sessions:
-            user_info = active_sessions[token]
-            del active_sessions[token]
+        user_info = await session_store.delete(token)
+        if user_info:
             logger.info(f"✅ User logged out: {user_info['email']}")
             return {"message": "Logged out successfully"}
         else:
@@ -153,11 +149,10 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
         # Extract token
         token = authorization.replace("Bearer ", "").strip()
 
-        if token not in active_sessions:
+        user_info = await session_store.get(token)
+        if not user_info:
             raise HTTPException(status_code=401, detail="Invalid or expired session")
 
-        user_info = active_sessions[token]
-
         return SessionInfo(
             user_id=user_info['user_id'],
             name=user_info['name'],
@@ -177,14 +172,4 @@ async def get_active_sessions():
     """
     Get count of active sessions (admin/debug endpoint)
     """
-    return {
-        "active_sessions": len(active_sessions),
-        "sessions": [
-            {
-                "user_id": session['user_id'],
-                "name": session['name'],
-                "role": session['role']
-            }
-            for session in active_sessions.values()
-        ]
-    }
+    return {"active_sessions": await session_store.count()}
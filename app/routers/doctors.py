@@ -3,13 +3,16 @@ Doctors Router for PneumAI
 Doctor management and registration
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import Response
+from typing import List, Optional
+import asyncio
 import logging
+import orjson
 
 from app.models.schemas import DoctorCreate, DoctorResponse
-from app.database import get_all_doctors, get_doctor, create_doctor
-from app.utils.helpers import generate_doctor_id
+from app.database import get_all_doctors, get_doctor, get_doctor_by_email, create_doctor, UniqueViolation
+from app.utils.helpers import generate_doctor_id, prefers_minimal_return
 from app.utils.security import (
     validate_email,
     validate_password_strength,
@@ -32,7 +35,8 @@ async def list_doctors():
     """
     try:
         doctors = get_all_doctors()
-        return doctors
+        # Rows come from our own schema; construct without re-validating
+        return [DoctorResponse.model_construct(**doctor) for doctor in doctors]
     except Exception as e:
         logger.error(f"Error fetching doctors: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch doctors")
@@ -51,7 +55,7 @@ async def get_doctor_by_id(doctor_id: str):
         if not doctor:
             raise HTTPException(status_code=404, detail=f"Doctor not found: {doctor_id}")
 
-        return doctor
+        return DoctorResponse.model_construct(**doctor)
     except HTTPException:
         raise
     except Exception as e:
@@ -60,11 +64,12 @@ async def get_doctor_by_id(doctor_id: str):
 
 
 @router.post("/register", response_model=DoctorResponse, status_code=201)
-async def register_doctor(doctor: DoctorCreate):
+async def register_doctor(doctor: DoctorCreate, prefer: Optional[str] = Header(None)):
     """
     Register a new doctor
 
-    Validates email, password strength, and creates secure password hash
+    Validates email, password strength, and creates secure password hash.
+    With "Prefer: return=minimal" only the new ID is returned.
     """
     try:
         # Validate email
@@ -76,6 +81,11 @@ async def register_doctor(doctor: DoctorCreate):
         if not is_valid:
             raise HTTPException(status_code=400, detail=error_message)
 
+        # Reject known duplicates before spending a bcrypt hash on them; the
+        # unique constraint still catches races with concurrent registrations
+        if get_doctor_by_email(doctor.email):
+            raise HTTPException(status_code=409, detail="Email already exists")
+
         # Sanitize inputs
         name = sanitize_input(doctor.name, max_length=255)
         specialization = sanitize_input(doctor.specialization, max_length=100) if doctor.specialization else None
@@ -84,14 +94,14 @@ async def register_doctor(doctor: DoctorCreate):
         # Generate doctor ID
         doctor_id = generate_doctor_id(doctor.email)
 
-        # Hash password
-        password_hash = hash_password(doctor.password)
+        # Hash password (bcrypt runs in a worker thread so the event loop keeps serving)
+        password_hash = await asyncio.to_thread(hash_password, doctor.password)
 
         # Prepare doctor data
         doctor_data = {
             'id': doctor_id,
             'name': name,
-            'email': doctor.email.lower(),
+            'email': doctor.email,
             'phone': doctor.phone,
             'specialization': specialization,
             'licenseNumber': license_number,
@@ -99,17 +109,24 @@ async def register_doctor(doctor: DoctorCreate):
         }
 
         # Create doctor
-        created_doctor = create_doctor(doctor_data)
+        minimal = prefers_minimal_return(prefer)
+        created_doctor = create_doctor(doctor_data, minimal=minimal)
 
         logger.info(f"✅ Doctor registered: {doctor_id} - {name}")
 
+        if minimal:
+            return Response(
+                content=orjson.dumps({"id": doctor_id}),
+                status_code=201,
+                media_type="application/json",
+                headers={"Preference-Applied": "return=minimal"}
+            )
         return created_doctor
 
     except HTTPException:
         raise
+    except UniqueViolation:
+        raise HTTPException(status_code=409, detail="Email already exists")
     except Exception as e:
         logger.error(f"Error registering doctor: {e}")
-        # Check for duplicate email
-        if "unique constraint" in str(e).lower() or "duplicate key" in str(e).lower():
-            raise HTTPException(status_code=409, detail="Email already exists")
         raise HTTPException(status_code=500, detail="Failed to register doctor")
@@ -4,8 +4,14 @@ Health and readiness endpoints for monitoring
 """
 
 from fastapi import APIRouter, HTTPException
+from collections import defaultdict
 from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import functools
 import logging
+import os
+import time
 
 from app.models.schemas import HealthResponse
 from app.database import Database
@@ -17,37 +23,85 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Probes hit these endpoints every few seconds; results are reused this long
+PROBE_CACHE_TTL_SECONDS = 5.0
+
+# Upload directory permissions rarely change; re-checked at most this often
+UPLOAD_DIR_CHECK_SECONDS = 60
+
+_probe_cache: Dict[str, Tuple[float, Any]] = {}
+_probe_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _cached_probe(slot: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Return a probe result computed within the TTL, refreshing it at most once at a time"""
+    entry = _probe_cache.get(slot)
+    if entry is not None and time.monotonic() - entry[0] < PROBE_CACHE_TTL_SECONDS:
+        return entry[1]
+
+    # Concurrent probes wait for a single refresh instead of each running the checks
+    async with _probe_locks[slot]:
+        entry = _probe_cache.get(slot)
+        if entry is not None and time.monotonic() - entry[0] < PROBE_CACHE_TTL_SECONDS:
+            return entry[1]
+
+        result = await compute()
+        _probe_cache[slot] = (time.monotonic(), result)
+        return result
+
+
+@router.get("/live")
+async def liveness_check():
+    """
+    Liveness check for orchestrators
+    Returns 200 while the process is serving requests; touches no dependencies
+    """
+    return {"status": "ok"}
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
     Basic health check endpoint
-    Returns system status and component health
+    Returns system status and component health (cached for a few seconds)
     """
-    # Check database connection
-    db_healthy = False
+    return await _cached_probe("health", _health)
+
+
+def _database_healthy() -> bool:
+    """Check database connection"""
     try:
-        with Database.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            db_healthy = True
+        Database.ping()
+        return True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        db_healthy = False
+        return False
+
+
+def _upload_dir_writable() -> bool:
+    """Check upload directory is writable (cached per UPLOAD_DIR_CHECK_SECONDS window)"""
+    return _upload_dir_access(int(time.monotonic() // UPLOAD_DIR_CHECK_SECONDS))
+
+
+@functools.lru_cache(maxsize=1)
+def _upload_dir_access(window: int) -> bool:
+    """Permission check without creating files; `window` only keys the cache"""
+    writable = os.access(settings.UPLOAD_DIR, os.W_OK)
+    if not writable:
+        logger.error(f"Upload directory not writable: {settings.UPLOAD_DIR}")
+    return writable
+
+
+async def _health() -> HealthResponse:
+    """Run the database, model and upload directory checks"""
+    # The database round trip runs in a worker thread
+    db_healthy = await asyncio.to_thread(_database_healthy)
 
     # Check YOLO model
     model_loaded = yolo_service.is_loaded()
 
     # Check upload directory is writable
-    upload_dir_writable = False
-    try:
-        test_file = settings.UPLOAD_DIR / ".health_check"
-        test_file.touch()
-        test_file.unlink()
-        upload_dir_writable = True
-    except Exception as e:
-        logger.error(f"Upload directory not writable: {e}")
-        upload_dir_writable = False
+    upload_dir_writable = _upload_dir_writable()
 
     # Overall status
     status = "healthy" if (db_healthy and model_loaded and upload_dir_writable) else "degraded"
@@ -65,69 +119,89 @@ async def health_check():
 async def readiness_check():
     """
     Readiness check for deployment platforms (Railway, Kubernetes, etc.)
-    Returns 200 if ready, 503 if not ready
+    Returns 200 if ready, 503 if not ready (cached for a few seconds)
     """
+    error = await _cached_probe("readiness", _readiness)
+    if error is not None:
+        raise HTTPException(status_code=503, detail=error)
+
+    return {"ready": True, "timestamp": datetime.utcnow().isoformat()}
+
+
+async def _readiness() -> Optional[str]:
+    """Check the database and model; returns the failure detail, or None if ready"""
     try:
         # Check database
-        with Database.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
+        await asyncio.to_thread(Database.ping)
 
         # Check YOLO model
         if not yolo_service.is_loaded():
-            raise HTTPException(status_code=503, detail="YOLO model not loaded")
+            return "YOLO model not loaded"
 
-        return {"ready": True, "timestamp": datetime.utcnow().isoformat()}
+        return None
 
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        raise HTTPException(status_code=503, detail=f"Service not ready: {str(e)}")
+        return f"Service not ready: {str(e)}"
 
 
 @router.get("/status")
 async def detailed_status():
     """
-    Detailed system status including storage and model info
+    Detailed system status including storage and model info (cached for a few seconds)
     """
     try:
-        # Database info
-        db_info = {"connected": False, "tables": []}
-        try:
-            with Database.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public'
-                    ORDER BY table_name
-                """)
-                db_info = {
-                    "connected": True,
-                    "tables": [row[0] for row in cursor.fetchall()]
-                }
-        except Exception as e:
-            logger.error(f"Database status check failed: {e}")
-
-        # YOLO model info
-        model_info = yolo_service.get_model_info()
-
-        # Storage info
-        storage_info = file_manager.get_storage_info()
-
-        return {
-            "application": {
-                "name": "PneumAI Unified Backend",
-                "version": "1.0.0",
-                "environment": settings.ENVIRONMENT
-            },
-            "database": db_info,
-            "model": model_info,
-            "storage": storage_info,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return await _cached_probe("status", _status)
 
     except Exception as e:
         logger.error(f"Status endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _database_info() -> Dict:
+    """List the public tables, or report the database as disconnected"""
+    try:
+        with Database.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT table_name
+                FROM information_schema.tables
+                WHERE table_schema = 'public'
+                ORDER BY table_name
+            """)
+            return {
+                "connected": True,
+                "tables": [row[0] for row in cursor.fetchall()]
+            }
+    except Exception as e:
+        logger.error(f"Database status check failed: {e}")
+        return {"connected": False, "tables": []}
+
+
+async def _status() -> Dict:
+    """Collect database, model and storage details"""
+    # Each check runs in its own worker thread; total latency is the slowest one
+    results = await asyncio.gather(
+        asyncio.to_thread(_database_info),
+        asyncio.to_thread(yolo_service.get_model_info),
+        asyncio.to_thread(file_manager.get_storage_info),
+        return_exceptions=True
+    )
+
+    # A failing check is reported in its own section instead of failing the endpoint
+    db_info, model_info, storage_info = (
+        {"healthy": False, "error": str(result)} if isinstance(result, Exception) else result
+        for result in results
+    )
+
+    return {
+        "application": {
+            "name": "PneumAI Unified Backend",
+            "version": "1.0.0",
+            "environment": settings.ENVIRONMENT
+        },
+        "database": db_info,
+        "model": model_info,
+        "storage": storage_info,
+        "timestamp": datetime.utcnow().isoformat()
+    }
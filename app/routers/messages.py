@@ -3,15 +3,17 @@ Messages Router for PneumAI
 Messaging system for doctor-patient communication
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List
 import logging
 
-from app.models.schemas import MessageCreate, MessageResponse, MessageOnlyResponse
+from app.models.schemas import MessageCreate, MessagesReadRequest, MessageResponse, MessageOnlyResponse
 from app.database import (
     create_message,
+    create_messages_bulk,
     get_user_messages,
     mark_message_read,
+    mark_messages_read,
     delete_message
 )
 from app.utils.helpers import generate_message_id
@@ -23,15 +25,20 @@ router = APIRouter()
 
 
 @router.get("/user/{user_id}", response_model=List[MessageResponse])
-async def get_messages_for_user(user_id: str):
+async def get_messages_for_user(
+    user_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """
     Get all messages for a user (sent and received)
 
-    Returns messages sorted by date (newest first)
+    Returns a page of messages sorted by date (newest first)
     """
     try:
-        messages = get_user_messages(user_id)
-        return messages
+        messages = get_user_messages(user_id, limit=limit, offset=offset)
+        # Rows come from our own schema; construct without re-validating
+        return [MessageResponse.model_construct(**message) for message in messages]
     except Exception as e:
         logger.error(f"Error fetching messages for user {user_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch messages")
@@ -75,6 +82,62 @@ async def send_message(message: MessageCreate):
         raise HTTPException(status_code=500, detail="Failed to send message")
 
 
+@router.post("/bulk", response_model=List[MessageResponse], status_code=201)
+async def send_messages_bulk(messages: List[MessageCreate]):
+    """
+    Send several messages at once
+
+    Inserts all messages in batched statements (up to 1000 per request)
+    """
+    if not messages:
+        return []
+    if len(messages) > 1000:
+        raise HTTPException(status_code=400, detail="At most 1000 messages per request")
+
+    try:
+        message_data = [
+            {
+                'id': generate_message_id(),
+                'senderId': message.senderId,
+                'senderName': message.senderName,
+                'senderRole': message.senderRole.value,
+                'receiverId': message.receiverId,
+                'receiverName': message.receiverName,
+                'content': sanitize_input(message.content, max_length=10000)
+            }
+            for message in messages
+        ]
+
+        created_messages = create_messages_bulk(message_data)
+
+        logger.info(f"✅ {len(created_messages)} messages sent")
+
+        return created_messages
+
+    except Exception as e:
+        logger.error(f"Error sending messages: {e}")
+        raise HTTPException(status_code=500, detail="Failed to send messages")
+
+
+@router.post("/read", response_model=MessageOnlyResponse)
+async def mark_messages_as_read(request: MessagesReadRequest):
+    """
+    Mark several messages as read
+
+    Updates the whole batch in a single statement
+    """
+    try:
+        updated = mark_messages_read(request.messageIds)
+
+        logger.info(f"✅ {updated} messages marked as read")
+
+        return MessageOnlyResponse(message=f"{updated} messages marked as read")
+
+    except Exception as e:
+        logger.error(f"Error marking messages as read: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update messages")
+
+
 @router.put("/{message_id}/read", response_model=MessageResponse)
 async def mark_message_as_read(message_id: str):
     """
@@ -3,7 +3,7 @@ Patients Router for PneumAI
 CRUD operations for patient management
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List
 import logging
 
@@ -13,7 +13,8 @@ from app.database import (
     get_patient,
     create_patient,
     update_patient,
-    delete_patient
+    delete_patient,
+    UniqueViolation
 )
 from app.utils.helpers import generate_patient_id
 from app.utils.security import validate_email, sanitize_input
@@ -25,14 +26,17 @@ router = APIRouter()
 
 @router.get("", response_model=List[PatientResponse])
 @router.get("/", response_model=List[PatientResponse])
-async def list_patients():
+async def list_patients(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """
     Get all patients
 
-    Returns list of all patients with their information
+    Returns a page of patients (newest first); use limit/offset to paginate
     """
     try:
-        patients = get_all_patients()
+        patients = get_all_patients(limit=limit, offset=offset)
         return patients
     except Exception as e:
         logger.error(f"Error fetching patients: {e}")
@@ -84,7 +88,7 @@ async def create_new_patient(patient: PatientCreate):
         patient_data = {
             'id': patient_id,
             'name': name,
-            'email': patient.email.lower(),
+            'email': patient.email,
             'phone': patient.phone,
             'dateOfBirth': patient.dateOfBirth.isoformat() if patient.dateOfBirth else None,
             'gender': patient.gender,
@@ -100,11 +104,10 @@ async def create_new_patient(patient: PatientCreate):
 
     except HTTPException:
         raise
+    except UniqueViolation:
+        raise HTTPException(status_code=409, detail="Email already exists")
     except Exception as e:
         logger.error(f"Error creating patient: {e}")
-        # Check for duplicate email
-        if "unique constraint" in str(e).lower() or "duplicate key" in str(e).lower():
-            raise HTTPException(status_code=409, detail="Email already exists")
         raise HTTPException(status_code=500, detail="Failed to create patient")
 
 
@@ -130,7 +133,7 @@ async def update_patient_info(patient_id: str, updates: PatientUpdate):
         if updates.name:
             update_data['name'] = sanitize_input(updates.name, max_length=255)
         if updates.email:
-            update_data['email'] = updates.email.lower()
+            update_data['email'] = updates.email
         if updates.phone:
             update_data['phone'] = updates.phone
         if updates.dateOfBirth:
@@ -149,10 +152,10 @@ async def update_patient_info(patient_id: str, updates: PatientUpdate):
 
     except HTTPException:
         raise
+    except UniqueViolation:
+        raise HTTPException(status_code=409, detail="Email already exists")
     except Exception as e:
         logger.error(f"Error updating patient {patient_id}: {e}")
-        if "unique constraint" in str(e).lower():
-            raise HTTPException(status_code=409, detail="Email already exists")
         raise HTTPException(status_code=500, detail="Failed to update patient")
 
 
@@ -3,17 +3,18 @@ Scans Router for PneumAI
 CT Scan upload, analysis, and comment management
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
+from fastapi import APIRouter, File, UploadFile, HTTPException, Form, Query, Request
 from fastapi.responses import Response
 from typing import Optional, List
 from datetime import datetime
+import asyncio
 import logging
+import os
+import orjson
+import traceback
 
 from app.models.schemas import (
     ScanResponse,
-    ScanResults,
-    ScanMetadata,
-    ImageSize,
     CommentCreate,
     CommentUpdate,
     CommentResponse,
@@ -25,6 +26,8 @@ from app.services.file_manager import file_manager
 from app.database import (
     create_scan,
     get_scan,
+    get_scan_summary,
+    get_scan_detections,
     get_patient_scans,
     delete_scan,
     create_scan_comment,
@@ -40,9 +43,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+def _base_url(request: Request) -> str:
+    """Origin for image URLs: PUBLIC_BASE_URL if configured, else the request's"""
+    return settings.PUBLIC_BASE_URL or str(request.base_url).rstrip('/')
+
 
 @router.post("/analyze", response_model=ScanResponse)
 async def analyze_scan(
+    request: Request,
     scan: UploadFile = File(...),
     patientId: Optional[str] = Form(None)
 ):
@@ -56,9 +64,12 @@ async def analyze_scan(
         # Record start time
         start_time = datetime.utcnow()
 
-        # Validate file size
-        contents = await scan.read()
-        file_size = len(contents)
+        # Validate file size. The upload is already spooled by the server
+        # (to disk past 1 MB), so its size is known without reading it
+        file_size = scan.size
+        if file_size is None:
+            file_size = scan.file.seek(0, os.SEEK_END)
+        await scan.seek(0)
 
         if file_size > settings.MAX_UPLOAD_SIZE_BYTES:
             raise HTTPException(
@@ -72,27 +83,32 @@ async def analyze_scan(
 
         logger.info(f"📤 Processing scan: {safe_filename} ({format_file_size(file_size)})")
 
-        # Read and process image
-        image = image_service.read_image(contents, safe_filename)
-
-        # Run YOLO inference
-        results = yolo_service.analyze(image)
+        # Decode straight from the spooled upload instead of a bytes copy of it
+        image = await asyncio.to_thread(image_service.read_image, scan.file, safe_filename)
 
-        # Create annotated image
-        annotated_image_bytes = image_service.create_annotated_image(image, results['detections'])
+        # Run YOLO inference off the event loop
+        results = await yolo_service.analyze_async(image)
 
-        # Encode original image
-        original_image_bytes = image_service.encode_image_to_jpeg(image)
+        # Create annotated image and encode original image side by side
+        # (OpenCV releases the GIL while encoding)
+        annotated_image_bytes, original_image_bytes = await asyncio.gather(
+            asyncio.to_thread(image_service.create_annotated_image, image, results['detections']),
+            asyncio.to_thread(image_service.encode_image_to_jpeg, image)
+        )
 
         # Generate scan ID
         scan_id = generate_scan_id()
 
-        # Save both images to filesystem
-        original_path, annotated_path = file_manager.save_scan_images(
+        # Save both images to filesystem before recording them
+        saved_paths = await asyncio.to_thread(
+            file_manager.save_scan_images,
             scan_id,
             original_image_bytes,
             annotated_image_bytes
         )
+        if saved_paths is None:
+            raise HTTPException(status_code=500, detail="Failed to save scan images")
+        original_path, annotated_path = saved_paths
 
         # Calculate processing time
         processing_time = (datetime.utcnow() - start_time).total_seconds()
@@ -119,53 +135,62 @@ async def analyze_scan(
             'annotatedPath': annotated_path
         }
 
-        # Save to database
-        create_scan(scan_data, results['detections'])
+        # Save to database; don't leave orphaned images behind if it fails
+        try:
+            await asyncio.to_thread(create_scan, scan_data, results['detections'])
+        except Exception:
+            await asyncio.to_thread(file_manager.delete_scan_files, scan_id)
+            raise
 
         logger.info(f"✅ Scan completed: {scan_id} - Risk: {results['riskLevel']} ({processing_time:.2f}s)")
 
         # Construct response with image URLs
-        base_url = f"http://localhost:{settings.PORT}"  # In production, use actual domain
-        image_urls = file_manager.get_scan_image_urls(scan_id, base_url)
-
-        return ScanResponse(
-            scanId=scan_id,
-            patientId=patientId,
-            status='completed',
-            uploadTime=start_time,
-            processingTime=processing_time,
-            results=ScanResults(
-                detected=results['detected'],
-                confidence=results['confidence'],
-                topClass=results['topClass'],
-                riskLevel=results['riskLevel'],
-                detections=results['detections'],
-                imageSize=ImageSize(**results['imageSize']),
-                imageUrl=image_urls['imageUrl'],
-                annotatedImageUrl=image_urls['annotatedImageUrl']
-            ),
-            metadata=ScanMetadata(
-                fileSize=file_size,
-                format=file_format,
-                imageSize=ImageSize(**results['imageSize'])
-            )
+        image_urls = file_manager.get_scan_image_urls(scan_id, _base_url(request))
+
+        # Model output is already in the ScanResponse shape; encode it directly
+        # instead of building a Pydantic object per detection
+        response = {
+            'scanId': scan_id,
+            'patientId': patientId,
+            'status': 'completed',
+            'uploadTime': start_time,
+            'processingTime': processing_time,
+            'results': {
+                'detected': results['detected'],
+                'confidence': results['confidence'],
+                'topClass': results['topClass'],
+                'riskLevel': results['riskLevel'],
+                'detections': results['detections'],
+                'imageSize': results['imageSize'],
+                'imageUrl': image_urls['imageUrl'],
+                'annotatedImageUrl': image_urls['annotatedImageUrl']
+            },
+            'metadata': {
+                'fileSize': file_size,
+                'format': file_format,
+                'imageSize': results['imageSize']
+            }
+        }
+        return Response(
+            content=orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type="application/json"
         )
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"❌ Error processing scan: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Scan processing failed: {str(e)}")
 
 
 @router.get("/{scan_id}")
-async def get_scan_by_id(scan_id: str):
+async def get_scan_by_id(request: Request, scan_id: str, include_detections: bool = Query(True)):
     """
     Get scan information by ID
 
-    Returns scan metadata and detection results
+    Returns scan metadata and detection results. Pass include_detections=false
+    for header-only views; detections are then served by /{scan_id}/detections.
     """
     try:
         scan = get_scan(scan_id)
@@ -174,11 +199,12 @@ async def get_scan_by_id(scan_id: str):
             raise HTTPException(status_code=404, detail=f"Scan not found: {scan_id}")
 
         # Add image URLs
-        base_url = f"http://localhost:{settings.PORT}"
-        image_urls = file_manager.get_scan_image_urls(scan_id, base_url)
+        image_urls = file_manager.get_scan_image_urls(scan_id, _base_url(request))
 
-        scan['results']['imageUrl'] = image_urls['imageUrl']
-        scan['results']['annotatedImageUrl'] = image_urls['annotatedImageUrl']
+        results = scan['results']
+        results.update(image_urls)
+        if not include_detections:
+            results['detectionCount'] = len(results.pop('detections'))
 
         return scan
 
@@ -189,16 +215,62 @@ async def get_scan_by_id(scan_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch scan")
 
 
+@router.get("/{scan_id}/detections")
+async def get_detections_for_scan(scan_id: str):
+    """
+    Get the detections of a scan
+
+    Returns only the detection list, without scan metadata
+    """
+    try:
+        detections = get_scan_detections(scan_id)
+
+        if detections is None:
+            raise HTTPException(status_code=404, detail=f"Scan not found: {scan_id}")
+
+        return {"scanId": scan_id, "detections": detections}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching detections for scan {scan_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch detections")
+
+
 @router.get("/patient/{patient_id}/scans")
-async def get_scans_for_patient(patient_id: str):
+async def get_scans_for_patient(
+    request: Request,
+    patient_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    before_time: Optional[datetime] = Query(None),
+    before_id: Optional[str] = Query(None)
+):
     """
     Get all scans for a patient
 
-    Returns list of scan summaries
+    Returns a page of scan summaries (newest first) with their image URLs.
+    Pass the nextCursor values back as before_time/before_id to fetch the
+    following page.
     """
+    if (before_time is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before_time and before_id must be given together")
+
     try:
-        scans = get_patient_scans(patient_id)
-        return {"scans": scans, "count": len(scans)}
+        before = (before_time, before_id) if before_time is not None else None
+        scans = get_patient_scans(patient_id, limit=limit, offset=offset, before=before)
+
+        # Include image URLs so clients don't need a follow-up request per scan
+        image_urls = file_manager.get_scan_image_urls_batch((scan['id'] for scan in scans), _base_url(request))
+        for scan in scans:
+            scan.update(image_urls[scan['id']])
+
+        next_cursor = None
+        if len(scans) == limit:
+            last = scans[-1]
+            next_cursor = {"before_time": last['upload_time'], "before_id": last['id']}
+
+        return {"scans": scans, "count": len(scans), "nextCursor": next_cursor}
     except Exception as e:
         logger.error(f"Error fetching scans for patient {patient_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch patient scans")
@@ -212,14 +284,10 @@ async def delete_scan_by_id(scan_id: str):
     Removes scan record from database and deletes associated image files
     """
     try:
-        # Check if scan exists
-        scan = get_scan(scan_id)
-        if not scan:
+        # Delete from database (cascade deletes detections and comments)
+        if not delete_scan(scan_id):
             raise HTTPException(status_code=404, detail=f"Scan not found: {scan_id}")
 
-        # Delete from database (cascade deletes detections)
-        delete_scan(scan_id)
-
         # Delete image files
         file_manager.delete_scan_files(scan_id)
 
@@ -247,7 +315,7 @@ async def add_comment_to_scan(scan_id: str, comment: CommentCreate):
     """
     try:
         # Verify scan exists
-        scan = get_scan(scan_id)
+        scan = get_scan_summary(scan_id)
         if not scan:
             raise HTTPException(status_code=404, detail=f"Scan not found: {scan_id}")
 
@@ -275,15 +343,20 @@ async def add_comment_to_scan(scan_id: str, comment: CommentCreate):
 
 
 @router.get("/{scan_id}/comments", response_model=List[CommentResponse])
-async def get_scan_comments_list(scan_id: str):
+async def get_scan_comments_list(
+    scan_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
     """
     Get all comments for a scan
 
-    Returns comments in chronological order
+    Returns a page of comments in chronological order
     """
     try:
-        comments = get_scan_comments(scan_id)
-        return comments
+        comments = get_scan_comments(scan_id, limit=limit, offset=offset)
+        # Rows come from our own schema; construct without re-validating
+        return [CommentResponse.model_construct(**comment) for comment in comments]
     except Exception as e:
         logger.error(f"Error fetching comments for scan {scan_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch comments")
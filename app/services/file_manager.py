@@ -4,7 +4,7 @@ Handles filesystem operations for CT scan images
 """
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 import aiofiles
 import logging
 import os
@@ -29,9 +29,7 @@ class FileManager:
 
     def _ensure_directories(self):
         """Create upload directories if they don't exist"""
-        for directory in [self.originals_dir, self.annotated_dir, self.thumbnails_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {directory}")
+        settings.ensure_dirs()
 
     # ============================================================
     # PATH GENERATION
@@ -252,7 +250,7 @@ class FileManager:
     # SCAN OPERATIONS
     # ============================================================
 
-    def save_scan_images(self, scan_id: str, original_bytes: bytes, annotated_bytes: bytes) -> Tuple[str, str]:
+    def save_scan_images(self, scan_id: str, original_bytes: bytes, annotated_bytes: bytes) -> Optional[Tuple[str, str]]:
         """
         Save both original and annotated images for a scan
 
@@ -262,19 +260,34 @@ class FileManager:
             annotated_bytes: Annotated image bytes
 
         Returns:
-            Tuple of (original_path, annotated_path) as relative strings
+            Tuple of (original_path, annotated_path) as relative strings,
+            or None if either image could not be written (nothing is left behind)
         """
-        original_path = self.get_original_path(scan_id)
-        annotated_path = self.get_annotated_path(scan_id)
-
         # Save both images
-        self.save_image(original_bytes, original_path)
-        self.save_image(annotated_bytes, annotated_path)
+        saved = (
+            self.save_image(original_bytes, self.get_original_path(scan_id))
+            and self.save_image(annotated_bytes, self.get_annotated_path(scan_id))
+        )
+        if not saved:
+            self.delete_scan_files(scan_id)
+            return None
 
         # Return relative paths for database storage
+        return self.get_scan_relative_paths(scan_id)
+
+    def get_scan_relative_paths(self, scan_id: str) -> Tuple[str, str]:
+        """
+        Get the relative paths a scan's images are stored under
+
+        Args:
+            scan_id: Scan ID
+
+        Returns:
+            Tuple of (original_path, annotated_path) as relative strings
+        """
         return (
-            self.get_relative_path(original_path),
-            self.get_relative_path(annotated_path)
+            self.get_relative_path(self.get_original_path(scan_id)),
+            self.get_relative_path(self.get_annotated_path(scan_id))
         )
 
     def delete_scan_files(self, scan_id: str) -> bool:
@@ -320,6 +333,31 @@ class FileManager:
             "annotatedImageUrl": f"{base_url}/uploads/{annotated_path}"
         }
 
+    def get_scan_image_urls_batch(self, scan_ids: Iterable[str], base_url: str = "") -> Dict[str, dict]:
+        """
+        Get URLs for the images of many scans
+
+        Same URLs as get_scan_image_urls, but the directory prefixes are
+        resolved once instead of per scan.
+
+        Args:
+            scan_ids: Scan IDs
+            base_url: Base URL for the API (optional)
+
+        Returns:
+            Dictionary mapping scan ID to its image URLs
+        """
+        originals_url = f"{base_url}/uploads/{self.get_relative_path(self.originals_dir)}"
+        annotated_url = f"{base_url}/uploads/{self.get_relative_path(self.annotated_dir)}"
+
+        return {
+            scan_id: {
+                "imageUrl": f"{originals_url}/{scan_id}.jpg",
+                "annotatedImageUrl": f"{annotated_url}/{scan_id}_annotated.jpg"
+            }
+            for scan_id in scan_ids
+        }
+
     # ============================================================
     # STORAGE INFO
     # ============================================================
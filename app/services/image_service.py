@@ -8,8 +8,9 @@ import numpy as np
 from PIL import Image
 import io
 import pydicom
-from typing import List, Dict, Optional
+from typing import BinaryIO, List, Dict, Optional, Union
 import logging
+import traceback
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +19,14 @@ class ImageService:
     """Service for image processing operations"""
 
     @staticmethod
-    def read_image(file_bytes: bytes, filename: str) -> np.ndarray:
+    def read_image(source: Union[bytes, BinaryIO], filename: str) -> np.ndarray:
         """
         Read uploaded image file into numpy array
         Supports DICOM, JPEG, PNG, and other standard formats
 
         Args:
-            file_bytes: Image file as bytes
+            source: Image file as bytes, or a seekable binary file positioned
+                at its start (decoded in place, without reading it into memory first)
             filename: Original filename
 
         Returns:
@@ -34,15 +36,16 @@ class ImageService:
             ValueError: If image format is not supported or cannot be decoded
         """
         try:
-            logger.info(f"Reading image: {filename}, size: {len(file_bytes)} bytes")
+            stream = io.BytesIO(source) if isinstance(source, bytes) else source
+            logger.info(f"Reading image: {filename}")
 
             # Check if it's a DICOM file
             if filename.lower().endswith('.dcm') or filename.lower().endswith('.dicom'):
-                return ImageService._read_dicom(file_bytes)
+                return ImageService._read_dicom(stream)
 
             # Try PIL for standard image formats
             try:
-                pil_image = Image.open(io.BytesIO(file_bytes))
+                pil_image = Image.open(stream)
                 logger.info(f"PIL opened image, mode: {pil_image.mode}, size: {pil_image.size}")
 
                 # Convert to RGB if needed
@@ -66,7 +69,8 @@ class ImageService:
                 logger.warning(f"PIL failed: {pil_error}, trying OpenCV...")
 
                 # Fallback to OpenCV
-                nparr = np.frombuffer(file_bytes, np.uint8)
+                stream.seek(0)
+                nparr = np.frombuffer(stream.read(), np.uint8)
                 image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
                 if image is None:
@@ -76,17 +80,16 @@ class ImageService:
 
         except Exception as e:
             logger.error(f"❌ Error reading image: {e}")
-            import traceback
             traceback.print_exc()
             raise ValueError(f"Invalid image file: {str(e)}")
 
     @staticmethod
-    def _read_dicom(file_bytes: bytes) -> np.ndarray:
+    def _read_dicom(stream: BinaryIO) -> np.ndarray:
         """
         Read DICOM file and convert to numpy array
 
         Args:
-            file_bytes: DICOM file as bytes
+            stream: DICOM file as a seekable binary file
 
         Returns:
             Image as numpy array (BGR format)
@@ -96,7 +99,7 @@ class ImageService:
         """
         try:
             logger.info("Detected DICOM file, parsing...")
-            dicom_data = pydicom.dcmread(io.BytesIO(file_bytes))
+            dicom_data = pydicom.dcmread(stream)
 
             # Get pixel data
             pixel_array = dicom_data.pixel_array.astype(np.float32)
@@ -146,7 +149,6 @@ class ImageService:
 
         except Exception as dicom_error:
             logger.error(f"❌ DICOM parsing failed: {dicom_error}")
-            import traceback
             traceback.print_exc()
             raise ValueError(f"Failed to parse DICOM file: {str(dicom_error)}")
 
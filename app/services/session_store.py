@@ -0,0 +1,115 @@
+"""
+Session Store Service for PneumAI
+Login sessions shared across workers via Redis, with an in-process fallback
+"""
+
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import time
+
+from app.config import settings
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # redis is optional; sessions then stay in-process
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """Session storage keyed by the SHA-256 of the token (raw tokens are never stored)"""
+
+    KEY_PREFIX = "sess:"
+    # Sorted set of session keys scored by expiry epoch, for O(log N) counts
+    ACTIVE_KEY = "sessions:active"
+    # The in-process fallback drops expired sessions at most this often
+    SWEEP_INTERVAL_SECONDS = 60.0
+
+    def __init__(self):
+        """Use Redis when REDIS_URL is set and the client is installed"""
+        self.ttl = settings.SESSION_EXPIRE_HOURS * 3600
+        self._redis = None
+        self._local: Dict[str, Tuple[float, Dict]] = {}
+        self._next_sweep = time.monotonic() + self.SWEEP_INTERVAL_SECONDS
+
+        if settings.REDIS_URL and redis is not None:
+            self._redis = redis.from_url(settings.REDIS_URL)
+            logger.info("✅ Sessions stored in Redis")
+        else:
+            logger.info("ℹ️  Sessions stored in-process (set REDIS_URL to share them across workers)")
+
+    def _key(self, token: str) -> str:
+        """Storage key for a session token"""
+        return self.KEY_PREFIX + hashlib.sha256(token.encode()).hexdigest()
+
+    async def create(self, token: str, session: Dict) -> None:
+        """Store a session for SESSION_EXPIRE_HOURS"""
+        key = self._key(token)
+        if self._redis is not None:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.setex(key, self.ttl, json.dumps(session))
+                pipe.zadd(self.ACTIVE_KEY, {key: time.time() + self.ttl})
+                await pipe.execute()
+        else:
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            self._local[key] = (now + self.ttl, session)
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired in-process sessions (tokens that are never read again would otherwise pile up)"""
+        self._local = {key: entry for key, entry in self._local.items() if entry[0] > now}
+        self._next_sweep = now + self.SWEEP_INTERVAL_SECONDS
+
+    async def get(self, token: str) -> Optional[Dict]:
+        """Return the session for a token, or None if unknown or expired"""
+        key = self._key(token)
+        if self._redis is not None:
+            value = await self._redis.get(key)
+            return json.loads(value) if value is not None else None
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._local.pop(key, None)
+            return None
+        return entry[1]
+
+    async def delete(self, token: str) -> Optional[Dict]:
+        """Remove a session; returns it if it existed"""
+        key = self._key(token)
+        if self._redis is not None:
+            # GET + DEL in one MULTI rather than GETDEL, which needs Redis 6.2+
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.get(key)
+                pipe.delete(key)
+                pipe.zrem(self.ACTIVE_KEY, key)
+                value, _, _ = await pipe.execute()
+            return json.loads(value) if value is not None else None
+
+        entry = self._local.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def count(self) -> int:
+        """Number of active sessions"""
+        if self._redis is not None:
+            now = time.time()
+            async with self._redis.pipeline(transaction=False) as pipe:
+                # Expired members are dropped here rather than by a sweeper
+                pipe.zremrangebyscore(self.ACTIVE_KEY, "-inf", now)
+                pipe.zcount(self.ACTIVE_KEY, now, "+inf")
+                _, total = await pipe.execute()
+            return total
+
+        now = time.monotonic()
+        return sum(1 for expires, _ in self._local.values() if expires > now)
+
+
+# Global session store instance
+session_store = SessionStore()
@@ -5,8 +5,8 @@ ID generation, date formatting, and common utilities
 
 from datetime import datetime, date, time
 from typing import Union, Optional
-import uuid
 import hashlib
+import secrets
 import logging
 
 logger = logging.getLogger(__name__)
@@ -65,26 +65,26 @@ def generate_doctor_id(email: str) -> str:
 
 def generate_appointment_id() -> str:
     """
-    Generate appointment ID with UUID
+    Generate random appointment ID
 
-    Format: apt_UUID
+    Format: apt_HEX16
 
     Returns:
         Unique appointment ID
     """
-    return f"apt_{uuid.uuid4().hex[:16]}"
+    return f"apt_{secrets.token_hex(8)}"
 
 
 def generate_message_id() -> str:
     """
-    Generate message ID with UUID
+    Generate random message ID
 
-    Format: msg_UUID
+    Format: msg_HEX16
 
     Returns:
         Unique message ID
     """
-    return f"msg_{uuid.uuid4().hex[:16]}"
+    return f"msg_{secrets.token_hex(8)}"
 
 
 def generate_session_token() -> str:
@@ -94,7 +94,7 @@ def generate_session_token() -> str:
     Returns:
         Secure random session token
     """
-    return uuid.uuid4().hex
+    return secrets.token_urlsafe(32)
 
 
 # ============================================================
@@ -388,6 +388,25 @@ def get_risk_color(risk_level: str) -> str:
     return colors.get(risk_level.lower(), "#6B7280")  # Gray default
 
 
+# ============================================================
+# HTTP HELPERS
+# ============================================================
+
+def prefers_minimal_return(prefer: Optional[str]) -> bool:
+    """
+    Check whether a Prefer header asks for return=minimal (RFC 7240)
+
+    Args:
+        prefer: Value of the Prefer request header, if any
+
+    Returns:
+        True if the client only needs the created resource's id
+    """
+    if not prefer:
+        return False
+    return any(token.strip().lower() == "return=minimal" for token in prefer.split(","))
+
+
 # ============================================================
 # HASH HELPERS
 # ============================================================
@@ -4,7 +4,9 @@ Password hashing, validation, and input sanitization
 """
 
 import bcrypt
+import functools
 import re
+import secrets
 from typing import Optional
 import logging
 
@@ -68,6 +70,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Throwaway bcrypt hash, created on first use"""
+    return hash_password(secrets.token_hex(16))
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Spend the same bcrypt work as verify_password against a throwaway hash
+
+    Used when no account matches, so response time doesn't reveal
+    which emails are registered. Always returns False.
+    """
+    verify_password(plain_password, _dummy_password_hash())
+    return False
+
+
 # ============================================================
 # INPUT VALIDATION
 # ============================================================
@@ -152,6 +171,14 @@ def validate_phone(phone: str) -> bool:
 # INPUT SANITIZATION
 # ============================================================
 
+# Deletes ASCII control characters other than tab and newline; for ASCII text
+# these are exactly the characters str.isprintable() rejects
+_ASCII_CONTROL_TABLE = dict.fromkeys([*range(0x00, 0x09), *range(0x0b, 0x20), 0x7f])
+
+# Anything but word characters, whitespace, dashes and dots in a filename
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s\-\.]')
+
+
 def sanitize_input(text: str, max_length: int = 1000) -> str:
     """
     Sanitize user input to prevent injection attacks
@@ -172,8 +199,12 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     # Limit length
     text = text[:max_length]
 
-    # Remove control characters except newlines and tabs
-    text = ''.join(char for char in text if char.isprintable() or char in ['\n', '\t'])
+    # Remove control characters except newlines and tabs; ASCII text takes
+    # the C-level translate path, only non-ASCII text needs the Unicode check
+    if text.isascii():
+        text = text.translate(_ASCII_CONTROL_TABLE)
+    else:
+        text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
 
     return text.strip()
 
@@ -222,7 +253,7 @@ def sanitize_filename(filename: str) -> str:
     filename = filename.split('\\')[-1]
 
     # Remove dangerous characters
-    filename = re.sub(r'[^\w\s\-\.]', '', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('', filename)
 
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
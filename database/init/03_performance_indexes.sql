@@ -0,0 +1,54 @@
+-- ========================================
+-- PneumAI Performance Indexes
+-- Composite indexes backing the API's hot listing queries
+-- ========================================
+
+-- Note: On an existing production database, create these with
+-- CREATE INDEX CONCURRENTLY to avoid locking writes
+
+-- ========================================
+-- MESSAGES
+-- get_user_messages reads the sender and receiver branches separately
+-- (UNION ALL), each ordered by created_at DESC
+-- ========================================
+CREATE INDEX IF NOT EXISTS idx_messages_sender_created
+    ON messages(sender_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_messages_receiver_created
+    ON messages(receiver_id, created_at DESC);
+
+-- ========================================
+-- CT SCANS
+-- Patient scan history ordered by (upload_time, scan_id) DESC; scan_id is
+-- the keyset tie-breaker, so it is a key column and the keyset predicate
+-- and ORDER BY are served without a sort. The other listed summary columns
+-- are INCLUDEd so the list is served by an index-only scan
+-- ========================================
+CREATE INDEX IF NOT EXISTS idx_scans_patient_upload
+    ON ct_scans(patient_id, upload_time DESC, scan_id DESC)
+    INCLUDE (status, risk_level, ai_confidence_score, nodules_detected);
+
+-- Time-range reports: scans are append-mostly, so a BRIN index on
+-- upload_time stays tiny while still pruning most of the table
+CREATE INDEX IF NOT EXISTS idx_scans_upload_time_brin
+    ON ct_scans USING BRIN (upload_time) WITH (pages_per_range = 32);
+
+-- Review queue: only the (few) scans still waiting on analysis
+CREATE INDEX IF NOT EXISTS idx_scans_pending
+    ON ct_scans(upload_time DESC)
+    WHERE status = 'pending';
+
+-- ========================================
+-- APPOINTMENTS
+-- Patient and doctor schedules ordered by date/time DESC
+-- ========================================
+CREATE INDEX IF NOT EXISTS idx_appointments_patient_date
+    ON appointments(patient_id, appointment_date DESC, appointment_time DESC);
+CREATE INDEX IF NOT EXISTS idx_appointments_doctor_date
+    ON appointments(doctor_id, appointment_date DESC, appointment_time DESC);
+
+-- ========================================
+-- SCAN COMMENTS
+-- Comment threads ordered by created_at ASC
+-- ========================================
+CREATE INDEX IF NOT EXISTS idx_scan_comments_scan_created
+    ON scan_comments(scan_id, created_at);